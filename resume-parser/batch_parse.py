@@ -0,0 +1,188 @@
+import os
+import sys
+import glob
+import time
+import argparse
+import multiprocessing
+
+from resume import ImprovedResumeParser, result_dict
+from parse_cache import ParseCache
+from exporters import open_exporter, FORMATS, COPY_SQL
+
+# File types picked up when a directory is given; see extractors.EXTENSIONS
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+# Parser owned by each pool worker, built once by _init_worker
+_worker_parser = None
+
+
+def collect_paths(target, extensions=RESUME_EXTENSIONS):
+    """Expand a directory or glob pattern into a sorted list of resume files.
+
+    A directory is searched recursively for files with one of ``extensions``;
+    a glob is taken as given.
+    """
+    if os.path.isdir(target):
+        return sorted(p for p in glob.glob(os.path.join(target, "**", "*"), recursive=True)
+                      if os.path.isfile(p) and os.path.splitext(p)[1].lower() in extensions)
+    return sorted(p for p in glob.glob(target, recursive=True) if os.path.isfile(p))
+
+
+def _chunks(items, size):
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _parse_chunk(parser, paths, batch_size):
+    """Extract text for a chunk of files and parse them in one nlp.pipe batch."""
+    records = []
+    texts = []
+    pending = []
+
+    keys = {}
+
+    for path in paths:
+        try:
+            cache_key, cached = parser.cache_lookup(path)
+            if cached is not None:
+                records.append({'path': path, 'ok': True, 'result': cached, 'error': None})
+                continue
+            keys[path] = cache_key
+            text = parser.extract_text_from_pdf(path)
+        except Exception as e:
+            text = None
+            records.append({'path': path, 'ok': False, 'result': None, 'error': str(e)})
+            continue
+        if not text:
+            records.append({'path': path, 'ok': False, 'result': None,
+                            'error': "Could not extract text from file"})
+            continue
+        texts.append(text)
+        pending.append(path)
+
+    try:
+        for path, results in zip(pending, parser.parse_texts(texts, batch_size=batch_size)):
+            records.append({'path': path, 'ok': True, 'result': results, 'error': None})
+            if keys.get(path):
+                # Compact parsers yield ParseResult objects; the cache stores plain dicts
+                parser.cache.put(keys[path], result_dict(results))
+    except Exception:
+        # A failure inside the batch loses the whole pipe; retry one by one to isolate it
+        done = {r['path'] for r in records}
+        for path, text in zip(pending, texts):
+            if path in done:
+                continue
+            try:
+                results = next(parser.parse_texts([text], batch_size=1))
+                records.append({'path': path, 'ok': True, 'result': results, 'error': None})
+            except Exception as e:
+                records.append({'path': path, 'ok': False, 'result': None, 'error': str(e)})
+
+    return records
+
+
+def _build_parser(fast_start, cache_path, near_dup_path):
+    cache = ParseCache(cache_path) if cache_path else None
+    near_dup = None
+    if near_dup_path:
+        from near_dup import NearDupIndex
+        near_dup = NearDupIndex(near_dup_path)
+    return ImprovedResumeParser(fast_start=fast_start, cache=cache, near_dup=near_dup)
+
+
+def _init_worker(fast_start, cache_path, near_dup_path=None):
+    """Build the per-process parser; worker progress logs go to stderr."""
+    global _worker_parser
+    sys.stdout = sys.stderr
+    _worker_parser = _build_parser(fast_start, cache_path, near_dup_path)
+
+
+def _worker_parse_chunk(args):
+    paths, batch_size = args
+    return _parse_chunk(_worker_parser, paths, batch_size)
+
+
+def parse_resumes(paths, batch_size=32, n_process=1, parser=None, fast_start=False, cache_path=None,
+                  near_dup_path=None):
+    """Parse many resumes, yielding one record per file as batches finish.
+
+    Each record is ``{'path', 'ok', 'result', 'error'}``. With ``n_process > 1``
+    the files are spread over a process pool, each worker holding its own
+    preloaded parser; records are yielded in completion order. ``cache_path``
+    points every worker at a shared ParseCache file, and ``near_dup_path`` at a
+    shared NearDupIndex.
+    """
+    paths = list(paths)
+    if not paths:
+        return
+
+    if n_process <= 1:
+        if parser is None:
+            parser = _build_parser(fast_start, cache_path, near_dup_path)
+        for chunk in _chunks(paths, batch_size):
+            yield from _parse_chunk(parser, chunk, batch_size)
+        return
+
+    tasks = [(chunk, batch_size) for chunk in _chunks(paths, batch_size)]
+    with multiprocessing.Pool(processes=n_process, initializer=_init_worker,
+                              initargs=(fast_start, cache_path, near_dup_path)) as pool:
+        for records in pool.imap_unordered(_worker_parse_chunk, tasks):
+            yield from records
+
+
+def main():
+    """Parse every resume in a directory or glob and stream the results as they finish."""
+    arg_parser = argparse.ArgumentParser(
+        description="Batch resume parser",
+        epilog=f"csv output loads with: {COPY_SQL}"
+    )
+    arg_parser.add_argument('target', help="Directory of resumes or a glob such as 'resumes/**/*.pdf'")
+    arg_parser.add_argument('--batch-size', type=int, default=32, help="Documents per nlp.pipe batch")
+    arg_parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                            help="Worker processes (default: CPU count)")
+    arg_parser.add_argument('--output', help="Write results here instead of stdout (required for parquet/arrow)")
+    arg_parser.add_argument('--format', choices=FORMATS, default='jsonl',
+                            help="jsonl records, csv for PostgreSQL COPY, or columnar parquet/arrow")
+    arg_parser.add_argument('--fast-start', action='store_true', help="Trimmed spaCy pipeline and lazy SkillNER")
+    arg_parser.add_argument('--cache', help="SQLite parse cache file shared by all workers")
+    arg_parser.add_argument('--near-dup', help="SQLite near-duplicate index; reuse skills of similar resumes")
+    args = arg_parser.parse_args()
+
+    paths = collect_paths(args.target)
+    if not paths:
+        print(f"❌ No resumes found for: {args.target}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        exporter = open_exporter(args.format, args.output, batch_rows=max(args.batch_size, 1000))
+    except (ValueError, ImportError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    # Keep stdout clean for results; parser progress goes to stderr
+    sys.stdout = sys.stderr
+
+    print(f"🚀 Parsing {len(paths)} resumes with {args.processes} process(es)")
+    started = time.perf_counter()
+    parsed = failed = 0
+    try:
+        for record in parse_resumes(paths, batch_size=args.batch_size, n_process=args.processes,
+                                    fast_start=args.fast_start, cache_path=args.cache,
+                                    near_dup_path=args.near_dup):
+            exporter.write(record)
+            exporter.flush()
+            if record['ok']:
+                parsed += 1
+            else:
+                failed += 1
+                print(f"❌ {record['path']}: {record['error']}")
+    finally:
+        exporter.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ Parsed {parsed} resumes, {failed} failed in {elapsed:.1f}s "
+          f"({(parsed + failed) / max(elapsed, 1e-9):.1f} files/s)")
+
+
+if __name__ == "__main__":
+    main()
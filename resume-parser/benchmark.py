@@ -0,0 +1,335 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import contextlib
+from collections import Counter
+
+import resume
+from resume import ImprovedResumeParser, ResumeText
+from extractors import BACKENDS
+from metrics import peak_rss_mb
+
+FIRST_NAMES = ["Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Sneha", "Arjun", "Kavya",
+               "Michael", "Sarah", "David", "Emily", "James", "Olivia", "Daniel", "Sophia"]
+LAST_NAMES = ["Sharma", "Gupta", "Patel", "Iyer", "Reddy", "Nair", "Singh", "Mehta",
+              "Smith", "Johnson", "Brown", "Williams", "Miller", "Davis", "Wilson", "Taylor"]
+COMPANIES = ["Infosys", "TCS", "Wipro", "Flipkart", "Zomato", "Google", "Microsoft", "Amazon",
+             "Acme Corp", "Globex", "Initech", "Umbrella Labs"]
+FILLER = ("Designed and shipped features end to end, worked closely with product and design, "
+          "reviewed pull requests, mentored junior engineers and improved reliability of "
+          "production services through better monitoring and on-call practices.")
+
+# Approximate line counts per synthetic resume size
+SIZES = {'short': 40, 'medium': 140, 'long': 420}
+
+STAGES = ['pdf_extract', 'spacy_header', 'name', 'contact', 'field_rules', 'skills_skillner',
+          'skills_fallback', 'experience', 'parse_pdf', 'parse_text']
+
+
+def synthetic_resume(rng, size, skills):
+    """Build one plain-text resume of roughly ``SIZES[size]`` lines."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    years = rng.randint(0, 20)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | +91 {rng.randint(60000, 99999)} {rng.randint(10000, 99999)}",
+        "Bengaluru, India",
+        "",
+        "SUMMARY",
+        f"Software engineer with {years}+ years of experience building web and data platforms.",
+        "",
+        "SKILLS",
+        "Technical Skills: " + ", ".join(rng.sample(skills, min(len(skills), rng.randint(8, 25)))),
+        "",
+        "EXPERIENCE",
+    ]
+    while len(lines) < SIZES[size]:
+        lines.append(f"{rng.choice(COMPANIES)} - Senior Engineer ({rng.randint(2008, 2025)})")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(f"- {FILLER} Used {', '.join(rng.sample(skills, 3))}.")
+        lines.append("")
+    lines += ["EDUCATION", "B.Tech in Computer Science, 2015"]
+    return "\n".join(lines)
+
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path, text, lines_per_page=60):
+    """Write ``text`` as a simple multi-page Helvetica PDF without any dependency."""
+    lines = [line.encode('latin-1', 'replace').decode('latin-1') for line in text.split('\n')]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects = {1: "<< /Type /Catalog /Pages 2 0 R >>",
+               3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for index, page_lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * index, 5 + 2 * index
+        kids.append(f"{page_id} 0 R")
+        body = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td"]
+        body += [f"({_pdf_escape(line)}) Tj T*" for line in page_lines]
+        body.append("ET")
+        stream = "\n".join(body)
+        objects[page_id] = ("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        objects[content_id] = f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += f"{obj_id} 0 obj\n{objects[obj_id]}\nendobj\n".encode('latin-1')
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    for obj_id in sorted(objects):
+        out += f"{offsets[obj_id]:010d} 00000 n \n".encode('latin-1')
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode('latin-1')
+
+    with open(path, 'wb') as file:
+        file.write(out)
+
+
+def build_corpus(directory, count, seed, skills):
+    """Generate ``count`` resumes as .txt and .pdf pairs; returns their base paths."""
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    size_names = list(SIZES)
+    bases = []
+    for index in range(count):
+        size = size_names[index % len(size_names)]
+        text = synthetic_resume(rng, size, skills)
+        base = os.path.join(directory, f"resume_{index:04d}_{size}")
+        with open(base + ".txt", 'w', encoding='utf-8') as file:
+            file.write(text)
+        write_pdf(base + ".pdf", text)
+        bases.append(base)
+    return bases
+
+
+def _timed(timings, stage, func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    timings.setdefault(stage, []).append(time.perf_counter() - started)
+    return result
+
+
+def _summary(samples):
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]
+    return {
+        'count': len(samples),
+        'total': round(sum(samples), 6),
+        'mean': round(sum(samples) / len(samples), 6),
+        'p50': round(pick(0.50), 6),
+        'p95': round(pick(0.95), 6),
+        'max': round(samples[-1], 6),
+    }
+
+
+def run_benchmark(parser, bases, repeat=1):
+    """Time every stage over the corpus and return a results dict."""
+    timings = {}
+    chars = 0
+    pdf_elapsed = text_elapsed = 0.0
+
+    for _ in range(repeat):
+        for base in bases:
+            text = _timed(timings, 'pdf_extract', parser.extract_text_from_pdf, base + ".pdf")
+            chars += len(text)
+
+            resume_text = ResumeText(text, parser.nlp)
+            _timed(timings, 'spacy_header', lambda: resume_text.header_doc)
+            _timed(timings, 'name', parser.extract_name, resume_text)
+            # The field rule scan is shared, so 'contact' also pays for 'experience'
+            _timed(timings, 'contact', parser.extract_contact_info, resume_text)
+            _timed(timings, 'field_rules', parser.field_rules.scan, text)
+            if parser.use_skillner and parser.skill_extractor:
+                # Same input as extract_skills_accurately: the whole text, cut at max_nlp_chars
+                nlp_text = text[:parser.max_nlp_chars] if parser.max_nlp_chars else text
+                _timed(timings, 'skills_skillner', parser.skill_extractor.annotate, nlp_text)
+            _timed(timings, 'skills_fallback', parser.skill_matcher.find_skills, text)
+            _timed(timings, 'experience', parser.extract_experience_years, resume_text)
+
+        started = time.perf_counter()
+        for base in bases:
+            _timed(timings, 'parse_pdf', parser.parse_resume, base + ".pdf")
+        pdf_elapsed += time.perf_counter() - started
+
+        texts = []
+        for base in bases:
+            with open(base + ".txt", 'r', encoding='utf-8') as file:
+                texts.append(file.read())
+        started = time.perf_counter()
+        for _ in parser.parse_texts(texts):
+            pass
+        elapsed = time.perf_counter() - started
+        text_elapsed += elapsed
+        timings.setdefault('parse_text', []).append(elapsed / max(len(texts), 1))
+
+    docs = len(bases) * repeat
+    return {
+        'stages': {stage: _summary(timings[stage]) for stage in STAGES if stage in timings},
+        'throughput': {
+            'pdf_docs_per_sec': round(docs / max(pdf_elapsed, 1e-9), 3),
+            'text_docs_per_sec': round(docs / max(text_elapsed, 1e-9), 3),
+            'chars_per_doc': round(chars / max(docs, 1)),
+        },
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def extraction_quality(text, truth):
+    """Word-level F1 between extracted text and the text the PDF was written from."""
+    found, expected = Counter(text.lower().split()), Counter(truth.lower().split())
+    overlap = sum((found & expected).values())
+    total = sum(found.values()) + sum(expected.values())
+    return 2 * overlap / total if total else 1.0
+
+
+def run_backend_benchmark(registry, bases, repeat=1):
+    """Time every installed PDF backend over the corpus and score its text against the .txt."""
+    truths = {}
+    for base in bases:
+        with open(base + ".txt", 'r', encoding='utf-8') as file:
+            truths[base] = file.read()
+
+    results = {}
+    for backend in registry.for_kind('pdf'):
+        seconds = 0.0
+        chars = errors = 0
+        scores = []
+        for _ in range(repeat):
+            for base in bases:
+                started = time.perf_counter()
+                try:
+                    text = "\n".join(backend.iter_pages(base + ".pdf", {}))
+                except Exception:
+                    errors += 1
+                    continue
+                seconds += time.perf_counter() - started
+                chars += len(text)
+                scores.append(extraction_quality(text, truths[base]))
+        results[backend.name] = {
+            'docs_per_sec': round(len(scores) / max(seconds, 1e-9), 3),
+            'chars_per_sec': round(chars / max(seconds, 1e-9)),
+            'quality': round(sum(scores) / len(scores), 4) if scores else 0.0,
+            'errors': errors,
+        }
+    return results
+
+
+def rank_backends(results, tolerance=0.02):
+    """Order backends for extractors.py: fastest among those within ``tolerance`` of the best quality first.
+
+    Backends that failed on any document or lost more text than that go last,
+    best quality first.
+    """
+    best = max((r['quality'] for r in results.values() if not r['errors']), default=0.0)
+    correct = lambda name: not results[name]['errors'] and results[name]['quality'] >= best - tolerance
+    fast = sorted((n for n in results if correct(n)), key=lambda n: -results[n]['docs_per_sec'])
+    rest = sorted((n for n in results if not correct(n)), key=lambda n: -results[n]['quality'])
+    return fast + rest
+
+
+def compare(current, baseline, threshold):
+    """Return a list of stages whose mean got slower than ``threshold`` (e.g. 0.2 = 20%)."""
+    regressions = []
+    for stage, stats in current['stages'].items():
+        before = baseline.get('stages', {}).get(stage)
+        if not before or not before['mean']:
+            continue
+        change = (stats['mean'] - before['mean']) / before['mean']
+        if change > threshold:
+            regressions.append({'stage': stage, 'before': before['mean'],
+                                'after': stats['mean'], 'change': round(change, 4)})
+    return regressions
+
+
+def main():
+    """Generate the synthetic corpus, run the benchmark and write JSON results."""
+    arg_parser = argparse.ArgumentParser(description="Resume parser performance benchmark")
+    arg_parser.add_argument('--count', type=int, default=30, help="Resumes in the synthetic corpus")
+    arg_parser.add_argument('--seed', type=int, default=1234)
+    arg_parser.add_argument('--repeat', type=int, default=1, help="Passes over the corpus")
+    arg_parser.add_argument('--corpus-dir', help="Where to write the corpus (default: a temp dir)")
+    arg_parser.add_argument('--fast-start', action='store_true')
+    arg_parser.add_argument('--extractor', choices=sorted(BACKENDS), help="Text extraction backend to prefer")
+    arg_parser.add_argument('--backends', action='store_true',
+                            help="Also compare speed and text quality of every installed PDF backend")
+    arg_parser.add_argument('--write-ranking', metavar='PATH',
+                            help="With --backends, save the resulting PDF backend order for the parser "
+                                 "(extractor_ranking.json next to resume.py is picked up by default)")
+    arg_parser.add_argument('--output', default="bench_results.json")
+    arg_parser.add_argument('--compare', help="Previous results file to check for regressions")
+    arg_parser.add_argument('--threshold', type=float, default=0.2,
+                            help="Allowed slowdown per stage before failing (default 20%%)")
+    args = arg_parser.parse_args()
+
+    corpus_dir = args.corpus_dir or tempfile.mkdtemp(prefix="resume_bench_")
+
+    # Parser progress would dominate the timings; silence it while measuring
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        started = time.perf_counter()
+        parser = ImprovedResumeParser(fast_start=args.fast_start, extractor=args.extractor)
+        startup = time.perf_counter() - started
+        # Build SkillNER up front so its setup is not charged to the first document
+        parser.init_skillner()
+        skills = sorted(parser.skill_matcher.categories)
+        bases = build_corpus(corpus_dir, args.count, args.seed, skills)
+        results = run_benchmark(parser, bases, repeat=args.repeat)
+        if args.backends:
+            results['backends'] = run_backend_benchmark(parser.extractors, bases, repeat=args.repeat)
+
+    results['meta'] = {
+        'parser_version': resume.PARSER_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'count': args.count,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'fast_start': args.fast_start,
+        'skillner': parser.use_skillner,
+        'extractors': parser.extractors.describe(),
+        'startup_seconds': round(startup, 4),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    print(f"✅ Results written to {args.output}")
+    for stage, stats in results['stages'].items():
+        print(f"   {stage:16s} mean {stats['mean'] * 1000:9.2f} ms   p95 {stats['p95'] * 1000:9.2f} ms")
+    print(f"   throughput      {results['throughput']['pdf_docs_per_sec']} PDF docs/s, "
+          f"{results['throughput']['text_docs_per_sec']} text docs/s")
+    print(f"   peak RSS        {results['peak_rss_mb']} MiB")
+    for name, stats in results.get('backends', {}).items():
+        print(f"   {name:16s} {stats['docs_per_sec']} docs/s, {stats['chars_per_sec']} chars/s, "
+              f"quality {stats['quality']}, {stats['errors']} errors")
+
+    if args.write_ranking and 'backends' in results:
+        ranking = rank_backends(results['backends'])
+        with open(args.write_ranking, 'w', encoding='utf-8') as file:
+            json.dump({'pdf': ranking}, file, indent=2)
+        print(f"✅ PDF backend ranking {ranking} written to {args.write_ranking}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        if regressions:
+            for r in regressions:
+                print(f"❌ {r['stage']} regressed {r['change'] * 100:.1f}% "
+                      f"({r['before'] * 1000:.2f} ms -> {r['after'] * 1000:.2f} ms)")
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
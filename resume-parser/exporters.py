@@ -0,0 +1,187 @@
+import sys
+import csv
+import json
+
+# Output columns for csv/parquet/arrow: the source file, the User fields the
+# server stores (firstName, lastName, email) and the parsed extras
+COLUMNS = ['source', 'firstName', 'lastName', 'email', 'phone', 'skills', 'expYears']
+
+FORMATS = ('jsonl', 'csv', 'parquet', 'arrow')
+
+# Staging table the csv output loads into with COPY ... FROM STDIN
+COPY_TABLE_SQL = (
+    'CREATE TABLE resume_imports (source text, "firstName" text, "lastName" text, email text, '
+    'phone text, skills text[], "expYears" integer)'
+)
+COPY_SQL = ('COPY resume_imports (source, "firstName", "lastName", email, phone, skills, "expYears") '
+            'FROM STDIN WITH (FORMAT csv, HEADER true)')
+
+
+def pg_array(values):
+    """Render a list of strings as a PostgreSQL array literal for COPY."""
+    escaped = ('"' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"' for v in values)
+    return '{' + ','.join(escaped) + '}'
+
+
+def _result_dict(result):
+    # ParseResult (low-memory parsers) or a plain dict
+    return result.to_dict() if hasattr(result, 'to_dict') else result
+
+
+def export_row(record):
+    """Flatten a batch_parse record ``{'path', 'ok', 'result', 'error'}`` into COLUMNS."""
+    result = _result_dict(record['result'])
+    return {
+        'source': record['path'],
+        'firstName': result.get('first_name'),
+        'lastName': result.get('last_name'),
+        'email': result.get('email'),
+        'phone': result.get('phone'),
+        'skills': list(result.get('skills') or []),
+        'expYears': result.get('exp_years'),
+    }
+
+
+class Exporter:
+    """Writes parse records as they arrive; ``close()`` finishes the output.
+
+    ``rows`` counts records written and ``skipped`` failed records left out
+    of formats that only hold results.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.skipped = 0
+
+    def write(self, record):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class StreamExporter(Exporter):
+    """Base for text formats written to an open stream, closed too if ``close_stream``."""
+
+    def __init__(self, stream, close_stream=False):
+        super().__init__()
+        self.stream = stream
+        self.close_stream = close_stream
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+        if self.close_stream:
+            self.stream.close()
+
+
+class JsonlExporter(StreamExporter):
+    """One JSON object per record, failures included."""
+
+    def write(self, record):
+        if record.get('result') is not None:
+            record = dict(record, result=_result_dict(record['result']))
+        self.stream.write(json.dumps(record) + "\n")
+        self.rows += 1
+
+
+class CopyCsvExporter(StreamExporter):
+    """CSV for PostgreSQL ``COPY ... WITH (FORMAT csv, HEADER true)``; see COPY_SQL.
+
+    Missing fields are written unquoted and empty, which COPY reads as NULL,
+    and skills as an array literal.
+    """
+
+    def __init__(self, stream, close_stream=False):
+        super().__init__(stream, close_stream)
+        self.writer = csv.writer(stream)
+        self.writer.writerow(COLUMNS)
+
+    def write(self, record):
+        if not record['ok']:
+            self.skipped += 1
+            return
+        row = export_row(record)
+        row['skills'] = pg_array(row['skills'])
+        self.writer.writerow(['' if row[column] is None else row[column] for column in COLUMNS])
+        self.rows += 1
+
+
+class ArrowExporter(Exporter):
+    """Columnar Parquet (``fmt='parquet'``) or Arrow IPC (``fmt='arrow'``) file.
+
+    Rows are buffered and written as one row group / record batch every
+    ``batch_rows`` rows, so memory is bounded by the batch, not the corpus.
+    Needs pyarrow.
+    """
+
+    def __init__(self, path, fmt='parquet', batch_rows=1000):
+        super().__init__()
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for parquet/arrow output: pip install pyarrow")
+        self.pa = pa
+        self.batch_rows = batch_rows
+        self.schema = pa.schema([
+            ('source', pa.string()),
+            ('firstName', pa.string()),
+            ('lastName', pa.string()),
+            ('email', pa.string()),
+            ('phone', pa.string()),
+            ('skills', pa.list_(pa.string())),
+            ('expYears', pa.int32()),
+        ])
+        if fmt == 'parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, self.schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self.schema)
+        self._buffer = []
+
+    def write(self, record):
+        if not record['ok']:
+            self.skipped += 1
+            return
+        self._buffer.append(export_row(record))
+        self.rows += 1
+        if len(self._buffer) >= self.batch_rows:
+            self._write_batch()
+
+    def _write_batch(self):
+        if self._buffer:
+            self._writer.write_table(self.pa.Table.from_pylist(self._buffer, schema=self.schema))
+            self._buffer = []
+
+    def close(self):
+        # flush() stays a no-op: the file is unreadable until its footer is written anyway
+        self._write_batch()
+        self._writer.close()
+
+
+def open_exporter(fmt, path=None, batch_rows=1000):
+    """Exporter for ``fmt`` writing to ``path``; jsonl and csv default to stdout.
+
+    The returned exporter owns ``path`` and closes it with ``close()``.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Choose from {', '.join(FORMATS)}")
+    if fmt in ('parquet', 'arrow'):
+        if not path:
+            raise ValueError(f"{fmt} output needs a file path")
+        return ArrowExporter(path, fmt, batch_rows)
+
+    stream = open(path, 'w', encoding='utf-8', newline='') if path else sys.stdout
+    exporter = JsonlExporter if fmt == 'jsonl' else CopyCsvExporter
+    return exporter(stream, close_stream=bool(path))
@@ -0,0 +1,245 @@
+import os
+import json
+import zipfile
+import importlib.util
+from xml.etree import ElementTree
+
+# Ranking written by ``benchmark.py --backends --write-ranking``; optional
+DEFAULT_RANKING_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extractor_ranking.json")
+
+# Preferred backends per document kind, best first. Unavailable ones are skipped;
+# pypdfium2 is fastest on large PDFs and pdfminer is the slowest of the three
+DEFAULT_RANKING = {
+    'pdf': ['pypdfium2', 'pypdf2', 'pdfminer'],
+    'docx': ['docx'],
+    'txt': ['text'],
+}
+
+EXTENSIONS = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.txt': 'txt',
+    '.text': 'txt',
+    '.md': 'txt',
+}
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+def detect_kind(path):
+    """Document kind of a file from its extension, or by sniffing its first bytes."""
+    kind = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if kind:
+        return kind
+    with open(path, 'rb') as file:
+        head = file.read(1024)
+    if head.startswith(b'%PDF'):
+        return 'pdf'
+    if head.startswith(b'PK') and zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            if 'word/document.xml' in archive.namelist():
+                return 'docx'
+        return None
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    return 'txt'
+
+
+class Extractor:
+    """A text extraction backend for one or more document kinds.
+
+    ``iter_pages`` yields page texts lazily so callers can stop early; it
+    sets ``stats['total_pages']`` when the page count is known up front.
+    """
+
+    name = None
+    kinds = ()
+    # Module that must be importable for the backend to be usable
+    module = None
+
+    def available(self):
+        return self.module is None or importlib.util.find_spec(self.module) is not None
+
+    def iter_pages(self, path, stats):
+        raise NotImplementedError
+
+
+class PyPDF2Extractor(Extractor):
+    """The original pure-Python extractor; always registered as the PDF fallback."""
+
+    name = 'pypdf2'
+    kinds = ('pdf',)
+    module = 'PyPDF2'
+
+    def __init__(self, loader=None):
+        # resume.load_pypdf2 can pip install PyPDF2 when it is missing
+        self.loader = loader
+
+    def available(self):
+        return self.loader is not None or super().available()
+
+    def iter_pages(self, path, stats):
+        PyPDF2 = self.loader() if self.loader else importlib.import_module('PyPDF2')
+        with open(path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            stats['total_pages'] = len(pdf_reader.pages)
+            for page in pdf_reader.pages:
+                yield page.extract_text() or ""
+
+
+class PdfiumExtractor(Extractor):
+    """pypdfium2 bindings to PDFium; much faster than PyPDF2 on long PDFs."""
+
+    name = 'pypdfium2'
+    kinds = ('pdf',)
+    module = 'pypdfium2'
+
+    def iter_pages(self, path, stats):
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(path)
+        try:
+            stats['total_pages'] = len(pdf)
+            for index in range(len(pdf)):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range().replace('\r\n', '\n')
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+
+
+class PdfMinerExtractor(Extractor):
+    """pdfminer.six layout analysis; slow, but keeps multi-column text in reading order."""
+
+    name = 'pdfminer'
+    kinds = ('pdf',)
+    module = 'pdfminer'
+
+    def iter_pages(self, path, stats):
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+        for layout in extract_pages(path):
+            yield "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+
+
+class DocxExtractor(Extractor):
+    """Reads the WordprocessingML inside a .docx with zipfile; no extra dependency.
+
+    Header parts come first, since resumes often keep the name and contact
+    details there. Explicit and last-rendered page breaks start a new page.
+    """
+
+    name = 'docx'
+    kinds = ('docx',)
+
+    def _parts(self, archive):
+        names = archive.namelist()
+        headers = sorted(n for n in names if n.startswith('word/header') and n.endswith('.xml'))
+        return headers + ['word/document.xml']
+
+    def iter_pages(self, path, stats):
+        with zipfile.ZipFile(path) as archive:
+            page, line = [], []
+            for part in self._parts(archive):
+                with archive.open(part) as xml:
+                    for _, element in ElementTree.iterparse(xml, events=('end',)):
+                        tag = element.tag
+                        if tag == _W + 't':
+                            line.append(element.text or "")
+                        elif tag == _W + 'tab':
+                            line.append('\t')
+                        elif tag == _W + 'br' and element.get(_W + 'type') != 'page':
+                            line.append('\n')
+                        elif tag == _W + 'p':
+                            page.append("".join(line))
+                            line = []
+                        elif (tag == _W + 'lastRenderedPageBreak'
+                              or (tag == _W + 'br' and element.get(_W + 'type') == 'page')):
+                            if page:
+                                yield "\n".join(page) + "\n"
+                                page = []
+                        else:
+                            continue
+                        element.clear()
+            if line:
+                page.append("".join(line))
+            if page:
+                yield "\n".join(page) + "\n"
+
+
+class TextExtractor(Extractor):
+    """Plain text files; form feeds separate pages."""
+
+    name = 'text'
+    kinds = ('txt',)
+
+    def iter_pages(self, path, stats):
+        page = []
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            for line in file:
+                while '\f' in line:
+                    before, line = line.split('\f', 1)
+                    page.append(before)
+                    yield "".join(page)
+                    page = []
+                page.append(line)
+        if page:
+            yield "".join(page)
+
+
+BACKENDS = {cls.name: cls for cls in (PyPDF2Extractor, PdfiumExtractor, PdfMinerExtractor,
+                                      DocxExtractor, TextExtractor)}
+
+
+def load_ranking(path=DEFAULT_RANKING_PATH):
+    """Backend ranking from a JSON file of ``{kind: [names]}``, merged over the default."""
+    ranking = {kind: list(names) for kind, names in DEFAULT_RANKING.items()}
+    if path and os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            ranking.update(json.load(file))
+    return ranking
+
+
+class ExtractorRegistry:
+    """Picks the best available backend for each file.
+
+    ``prefer`` names a backend to use for the kinds it handles whenever it
+    is available; otherwise backends are tried in ``ranking`` order.
+    """
+
+    def __init__(self, ranking=None, prefer=None, pypdf2_loader=None):
+        if prefer is not None and prefer not in BACKENDS:
+            raise ValueError(f"Unknown extractor: {prefer}. Choose from {', '.join(sorted(BACKENDS))}")
+        self.ranking = ranking if ranking is not None else load_ranking()
+        self.prefer = prefer
+        self.backends = {}
+        for name, cls in BACKENDS.items():
+            backend = cls(pypdf2_loader) if cls is PyPDF2Extractor else cls()
+            if backend.available():
+                self.backends[name] = backend
+
+    def for_kind(self, kind):
+        """Available backends for ``kind``, best first."""
+        names = list(self.ranking.get(kind, []))
+        if self.prefer in self.backends and kind in BACKENDS[self.prefer].kinds:
+            names.insert(0, self.prefer)
+        names += [name for name, cls in BACKENDS.items() if kind in cls.kinds]
+        return [self.backends[name] for name in dict.fromkeys(names) if name in self.backends]
+
+    def select(self, path):
+        kind = detect_kind(path)
+        if kind is None:
+            raise ValueError(f"Unsupported document type: {os.path.basename(path)}")
+        backends = self.for_kind(kind)
+        if not backends:
+            raise ValueError(f"No extractor available for {kind} files")
+        return backends[0]
+
+    def describe(self):
+        """``{kind: [backend names]}`` in the order they would be used."""
+        return {kind: [b.name for b in self.for_kind(kind)] for kind in sorted(set(EXTENSIONS.values()))}
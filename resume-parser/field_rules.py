@@ -0,0 +1,95 @@
+import os
+import re
+import json
+
+# Rules shipped with the parser; pass another file to FieldRuleEngine.from_file for new locales
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "field_rules.json")
+
+
+class FieldRuleEngine:
+    """Compiles every field rule once and scans a text with them in order.
+
+    Each rule is a dict with ``field``, ``pattern`` and optional ``name``,
+    ``value_group`` (capture group holding the value), ``type`` (``"int"``),
+    ``min``/``max`` (value range) and ``min_digits``/``max_digits`` (digit
+    count, e.g. for phone numbers). Rules are matched case-insensitively
+    unless ``case_sensitive`` is set. Where matches of different rules
+    overlap, the leftmost wins and then the earlier rule, so locale-specific
+    rules should come before generic ones.
+    """
+
+    def __init__(self, rules):
+        """Validate the rules and compile each pattern on its own."""
+        self.rules = []
+        for index, rule in enumerate(rules):
+            if 'field' not in rule or 'pattern' not in rule:
+                raise ValueError(f"Rule {index} needs 'field' and 'pattern'")
+            flags = 0 if rule.get('case_sensitive') else re.IGNORECASE
+            try:
+                regex = re.compile(rule['pattern'], flags)
+            except re.error as e:
+                raise ValueError(f"Rule {rule.get('name', index)} has an invalid pattern: {e}")
+            if rule.get('value_group', 0) > regex.groups:
+                raise ValueError(f"Rule {rule.get('name', index)} has no group {rule['value_group']}")
+            self.rules.append(dict(rule, name=rule.get('name', f"rule_{index}"), regex=regex))
+
+        self.fields = list(dict.fromkeys(rule['field'] for rule in self.rules))
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_RULES_PATH):
+        """Load rules from a JSON file of the form ``{"rules": [...]}``."""
+        with open(path, 'r', encoding='utf-8') as file:
+            return cls(json.load(file)['rules'])
+
+    def _value(self, rule, match):
+        """Turn a raw match into a field value, or None if it fails validation."""
+        value = match.group(rule.get('value_group', 0)).strip()
+
+        if 'min_digits' in rule or 'max_digits' in rule:
+            digits = sum(ch.isdigit() for ch in value)
+            if not rule.get('min_digits', 0) <= digits <= rule.get('max_digits', digits):
+                return None
+
+        if rule.get('type') == 'int':
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+            if not rule.get('min', value) <= value <= rule.get('max', value):
+                return None
+
+        return value
+
+    def scan(self, text):
+        """Return ``{field: [values...]}`` found in ``text``.
+
+        Values keep their order of appearance and are deduplicated; values
+        that differ only in punctuation (``555-123-4567`` vs ``5551234567``)
+        count as the same.
+        """
+        found = {field: [] for field in self.fields}
+        seen = {field: set() for field in self.fields}
+
+        # Every rule's matches, then merged as one left-to-right pass would see
+        # them: the leftmost match wins, then the earlier rule
+        matches = [(match.start(), index, match) for index, rule in enumerate(self.rules)
+                   for match in rule['regex'].finditer(text)]
+        matches.sort(key=lambda item: (item[0], item[1]))
+
+        claimed = 0
+        for start, index, match in matches:
+            if start < claimed:
+                continue
+            # An invalid match still claims its span, so a later rule cannot re-read it
+            claimed = max(match.end(), start + 1)
+            rule = self.rules[index]
+            value = self._value(rule, match)
+            if value is None:
+                continue
+            key = re.sub(r'\W', '', value).lower() if isinstance(value, str) else value
+            if key in seen[rule['field']]:
+                continue
+            seen[rule['field']].add(key)
+            found[rule['field']].append(value)
+
+        return found
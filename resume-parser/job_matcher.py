@@ -0,0 +1,224 @@
+import sys
+import json
+import argparse
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def normalize_skill(skill):
+    """Lowercase and trim a tag or parsed skill so both sides compare equal."""
+    return ' '.join(str(skill).lower().split())
+
+
+def load_jobs(path):
+    """Read a job snapshot exported as a JSON array or as JSON lines."""
+    with open(path, 'r', encoding='utf-8') as file:
+        head = file.read(1)
+        while head and head.isspace():
+            head = file.read(1)
+        file.seek(0)
+        if head == '[':
+            return json.load(file)
+        return [json.loads(line) for line in file if line.strip()]
+
+
+class JobIndex:
+    """Sparse job x skill matrix over Prisma ``Job`` rows for fast resume matching.
+
+    Each job becomes one row with a 1 for every tag. The column (CSC) view of
+    the same matrix is the inverted index: scoring a resume only touches the
+    postings of the skills it lists. Scores are the IDF-weighted share of a
+    job's tags the candidate has, so rare skills count for more than ones
+    every job mentions.
+    """
+
+    def __init__(self):
+        self.vocab = {}
+        self.skills = []
+        self.job_ids = []
+        self.jobs = []
+        self._row_of = {}
+
+        self.min_exp = np.empty(0, dtype=np.float32)
+        self.max_exp = np.empty(0, dtype=np.float32)
+        self.categories = np.empty(0, dtype=object)
+        self.active = np.empty(0, dtype=bool)
+        self.matrix = sp.csr_matrix((0, 0), dtype=np.float32)
+
+        # Rows added since the last rebuild, keyed by job id and merged lazily on the next query
+        self._pending = {}
+        self._postings = None
+        self._idf = None
+        self._job_weight = None
+
+    @classmethod
+    def from_snapshot(cls, path):
+        index = cls()
+        index.add_jobs(load_jobs(path))
+        return index
+
+    def __len__(self):
+        self._flush()
+        return int(self.active.sum())
+
+    def _column(self, skill):
+        column = self.vocab.get(skill)
+        if column is None:
+            column = self.vocab[skill] = len(self.skills)
+            self.skills.append(skill)
+        return column
+
+    def add_jobs(self, jobs):
+        """Add or replace jobs; a job whose ``id`` is already indexed is replaced."""
+        for job in jobs:
+            job_id = job.get('id')
+            self.remove(job_id)
+            if job.get('isActive') is False:
+                continue
+            tags = {normalize_skill(tag) for tag in job.get('tags') or [] if str(tag).strip()}
+            key = job_id if job_id is not None else ('unkeyed', len(self._pending), len(self.job_ids))
+            self._pending[key] = (job, sorted(self._column(tag) for tag in tags))
+
+    def remove(self, job_id):
+        """Drop a job from future results (its row is masked, not rebuilt)."""
+        if job_id is None:
+            return
+        self._pending.pop(job_id, None)
+        row = self._row_of.pop(job_id, None)
+        if row is not None:
+            self.active[row] = False
+            # Document frequencies changed; recompute IDF on the next query
+            self._postings = None
+
+    def _flush(self):
+        """Append pending rows to the matrix and refresh the derived arrays."""
+        if not self._pending:
+            if self._postings is None and self.matrix.shape[0]:
+                self._refresh()
+            return
+
+        pending, self._pending = list(self._pending.values()), {}
+        indptr = [0]
+        indices = []
+        for job, columns in pending:
+            indices.extend(columns)
+            indptr.append(len(indices))
+            self._row_of[job.get('id')] = len(self.job_ids)
+            self.job_ids.append(job.get('id'))
+            self.jobs.append({
+                'id': job.get('id'),
+                'title': job.get('title'),
+                'companyName': job.get('companyName'),
+                'category': job.get('category'),
+                'location': job.get('location'),
+                'jobUrl': job.get('jobUrl'),
+            })
+
+        columns = len(self.skills)
+        new_rows = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr)),
+            shape=(len(pending), columns)
+        )
+        old = self.matrix
+        if old.shape[1] != columns:
+            old = sp.csr_matrix((old.data, old.indices, old.indptr), shape=(old.shape[0], columns))
+        self.matrix = sp.vstack([old, new_rows], format='csr')
+
+        to_float = lambda value: np.nan if value is None else float(value)
+        self.min_exp = np.concatenate([self.min_exp, np.array(
+            [to_float(job.get('minExperience')) for job, _ in pending], dtype=np.float32)])
+        self.max_exp = np.concatenate([self.max_exp, np.array(
+            [to_float(job.get('maxExperience')) for job, _ in pending], dtype=np.float32)])
+        self.categories = np.concatenate([self.categories, np.array(
+            [job.get('category') for job, _ in pending], dtype=object)])
+        self.active = np.concatenate([self.active, np.ones(len(pending), dtype=bool)])
+        self._refresh()
+
+    def _refresh(self):
+        live = self.matrix[self.active] if not self.active.all() else self.matrix
+        df = np.asarray((live > 0).sum(axis=0)).ravel()
+        n = max(live.shape[0], 1)
+        self._idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+        self._job_weight = np.asarray(self.matrix @ self._idf).ravel()
+        self._postings = self.matrix.tocsc()
+
+    def match(self, skills, exp_years=None, top_k=10, category=None, exp_slack=0):
+        """Return the ``top_k`` best jobs for a candidate's skills and experience.
+
+        Jobs outside their ``minExperience``/``maxExperience`` range (widened by
+        ``exp_slack`` years) and, if given, outside ``category`` are skipped.
+        """
+        self._flush()
+        n_jobs = self.matrix.shape[0]
+        if not n_jobs:
+            return []
+
+        columns = sorted({self.vocab[s] for s in map(normalize_skill, skills) if s in self.vocab})
+        if not columns:
+            return []
+
+        # One sparse mat-vec over the postings of the candidate's skills only
+        hits = self._postings[:, columns]
+        scores = np.asarray(hits @ self._idf[columns]).ravel()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(self._job_weight > 0, scores / self._job_weight, 0.0)
+
+        mask = self.active & (scores > 0)
+        if exp_years is not None:
+            mask &= np.isnan(self.min_exp) | (self.min_exp - exp_slack <= exp_years)
+            mask &= np.isnan(self.max_exp) | (exp_years <= self.max_exp + exp_slack)
+        if category is not None:
+            mask &= self.categories == category
+
+        candidates = np.flatnonzero(mask)
+        if not len(candidates):
+            return []
+        if len(candidates) > top_k:
+            best = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+            candidates = candidates[best]
+        candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        wanted = set(columns)
+        results = []
+        for row in candidates:
+            job_columns = self.matrix.indices[self.matrix.indptr[row]:self.matrix.indptr[row + 1]]
+            results.append(dict(
+                self.jobs[row],
+                score=round(float(scores[row]), 4),
+                matched=[self.skills[c] for c in job_columns if c in wanted],
+                missing=[self.skills[c] for c in job_columns if c not in wanted],
+            ))
+        return results
+
+    def match_resume(self, results, top_k=10, **kwargs):
+        """Match a parsed resume dict (``skills``/``exp_years``) against the index."""
+        return self.match(results.get('skills') or [], results.get('exp_years'), top_k=top_k, **kwargs)
+
+
+def main():
+    """Rank jobs from a snapshot for one parsed resume."""
+    arg_parser = argparse.ArgumentParser(description="Match parsed resumes against a job snapshot")
+    arg_parser.add_argument('jobs', help="Job snapshot as a JSON array or JSON lines")
+    arg_parser.add_argument('resume', help="Parsed resume JSON (resume.py --quiet output)")
+    arg_parser.add_argument('--top-k', type=int, default=10)
+    arg_parser.add_argument('--category')
+    arg_parser.add_argument('--exp-slack', type=int, default=0,
+                            help="Years a candidate may be outside a job's experience range")
+    args = arg_parser.parse_args()
+
+    index = JobIndex.from_snapshot(args.jobs)
+    with open(args.resume, 'r', encoding='utf-8') as file:
+        parsed = json.load(file)
+    # Accept batch_parse records as well as bare parser results
+    parsed = parsed.get('result', parsed)
+
+    matches = index.match_resume(parsed, top_k=args.top_k, category=args.category,
+                                 exp_slack=args.exp_slack)
+    print(f"✅ {len(matches)} matches out of {len(index)} jobs", file=sys.stderr)
+    for match in matches:
+        print(json.dumps(match))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import io
+import os
+import sys
+import json
+import time
+import resource
+import pstats
+import cProfile
+import threading
+from contextlib import contextmanager
+
+
+class Metrics:
+    """Thread-safe timing spans, counters and value summaries for the parser.
+
+    Spans and observed values keep count/sum/min/max only, so memory stays
+    constant no matter how many documents are parsed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.spans = {}
+            self.counters = {}
+            self.values = {}
+            self.started_at = time.time()
+
+    @staticmethod
+    def _add(table, name, value):
+        entry = table.get(name)
+        if entry is None:
+            table[name] = {'count': 1, 'sum': value, 'min': value, 'max': value}
+        else:
+            entry['count'] += 1
+            entry['sum'] += value
+            entry['min'] = min(entry['min'], value)
+            entry['max'] = max(entry['max'], value)
+
+    @contextmanager
+    def span(self, name):
+        """Time the enclosed block as one sample of stage ``name``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name, seconds):
+        """Add an already-measured duration for stage ``name``."""
+        with self._lock:
+            self._add(self.spans, name, seconds)
+
+    def incr(self, name, value=1):
+        """Increase counter ``name``."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        """Record one sample of a size-like value such as characters per document."""
+        with self._lock:
+            self._add(self.values, name, value)
+
+    def snapshot(self):
+        """Return a JSON-serialisable copy of all metrics."""
+        with self._lock:
+            summarize = lambda table: {
+                name: dict(entry, mean=entry['sum'] / entry['count'])
+                for name, entry in table.items()
+            }
+            return {
+                'uptime': time.time() - self.started_at,
+                'spans': summarize(self.spans),
+                'counters': dict(self.counters),
+                'values': summarize(self.values),
+            }
+
+    def to_json(self, indent=None):
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix="resume_parser"):
+        """Render the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+
+        lines.append(f"# TYPE {prefix}_stage_seconds summary")
+        for name, entry in sorted(snapshot['spans'].items()):
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {entry["count"]}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {entry["sum"]:.6f}')
+        lines.append(f"# TYPE {prefix}_stage_seconds_max gauge")
+        for name, entry in sorted(snapshot['spans'].items()):
+            lines.append(f'{prefix}_stage_seconds_max{{stage="{name}"}} {entry["max"]:.6f}')
+
+        for name, value in sorted(snapshot['counters'].items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+
+        for name, entry in sorted(snapshot['values'].items()):
+            lines.append(f"# TYPE {prefix}_{name} summary")
+            lines.append(f"{prefix}_{name}_count {entry['count']}")
+            lines.append(f"{prefix}_{name}_sum {entry['sum']}")
+
+        return "\n".join(lines) + "\n"
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def rss_mb():
+    """Current resident set size of this process in MiB (peak RSS where /proc is missing)."""
+    try:
+        with open('/proc/self/statm', 'r') as file:
+            resident_pages = int(file.read().split()[1])
+        return round(resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 1)
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+def profile_call(func, *args, sort='cumulative', limit=30, **kwargs):
+    """Run ``func`` under cProfile; returns ``(result, report_text)``."""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+    return result, stream.getvalue()
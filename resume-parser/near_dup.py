@@ -0,0 +1,344 @@
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+import threading
+
+import numpy as np
+
+# Prime just above 2**32: (a * h + b) over 32-bit values stays inside uint64
+_PRIME = np.uint64(4294967311)
+_MASK = np.uint64(0xFFFFFFFF)
+_WORD = re.compile(r'\w+')
+
+
+def shingles(text, size=3):
+    """Set of lowercased ``size``-word shingles; short texts become one shingle."""
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def text_id(text):
+    """Stable id for an extracted resume text."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class MinHasher:
+    """MinHash signatures over word shingles, ``num_perm`` 32-bit values each."""
+
+    def __init__(self, num_perm=128, shingle_size=3, seed=1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 2 ** 32, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.randint(0, 2 ** 32, size=(num_perm, 1), dtype=np.uint64)
+
+    def signature(self, text):
+        grams = shingles(text, self.shingle_size)
+        if not grams:
+            return np.full(self.num_perm, 0xFFFFFFFF, dtype=np.uint32)
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=4).digest(), 'little')
+             for g in grams),
+            dtype=np.uint64, count=len(grams)
+        )
+        # One (num_perm x shingles) pass of universal hashing, min over shingles
+        permuted = ((self._a * hashes + self._b) % _PRIME) & _MASK
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(sig_a == sig_b))
+
+
+class NearDupIndex:
+    """Persistent MinHash/LSH index of extracted resume texts.
+
+    Signatures are split into ``bands`` bands; two texts become candidates
+    when any band hashes to the same bucket, so a query only looks at the
+    handful of documents sharing a bucket instead of the whole corpus.
+    Candidates are then confirmed against ``threshold`` using the full
+    signature. Documents can be inserted one at a time, and each keeps the
+    parse result it was stored with so near-duplicates can reuse it.
+    """
+
+    def __init__(self, path="near_dup.sqlite", num_perm=128, bands=16, threshold=0.8,
+                 shingle_size=3, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.path = path
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size, seed)
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            " doc_id TEXT PRIMARY KEY,"
+            " signature BLOB NOT NULL,"
+            " info TEXT,"
+            " result TEXT,"
+            " fingerprint TEXT,"
+            " added_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            " band INTEGER NOT NULL,"
+            " bucket INTEGER NOT NULL,"
+            " doc_id TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, bucket)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS buckets_doc ON buckets (doc_id)")
+
+        # Signatures from different settings are not comparable
+        config = json.dumps({'num_perm': num_perm, 'bands': bands,
+                             'shingle_size': shingle_size, 'seed': seed}, sort_keys=True)
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'config'").fetchone()
+        if row is None:
+            self._db.execute("INSERT INTO meta (key, value) VALUES ('config', ?)", (config,))
+        elif row[0] != config:
+            raise ValueError(f"{path} was built with different settings: {row[0]}")
+        self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def _buckets(self, signature):
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            # 7 bytes keeps the bucket a positive SQLite integer
+            yield band, int.from_bytes(hashlib.blake2b(chunk, digest_size=7).digest(), 'little')
+
+    def insert(self, doc_id, text=None, signature=None, info=None, result=None, fingerprint=None):
+        """Add or update one document; pass its ``text`` or a precomputed ``signature``.
+
+        Fields passed as None keep their stored values, so tagging a document
+        with ``info`` never drops the ``result``/``fingerprint`` a parser saved.
+        """
+        if signature is None:
+            signature = self.hasher.signature(text)
+        with self._lock:
+            self._db.execute("DELETE FROM buckets WHERE doc_id = ?", (doc_id,))
+            self._db.execute(
+                "INSERT INTO docs (doc_id, signature, info, result, fingerprint, added_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (doc_id) DO UPDATE SET signature = excluded.signature,"
+                " info = COALESCE(excluded.info, info),"
+                # A result and the fingerprint it was parsed under are only replaced together
+                " fingerprint = CASE WHEN excluded.result IS NULL THEN fingerprint ELSE excluded.fingerprint END,"
+                " result = COALESCE(excluded.result, result),"
+                " added_at = excluded.added_at",
+                (doc_id, signature.astype(np.uint32).tobytes(),
+                 json.dumps(info) if info is not None else None,
+                 json.dumps(result) if result is not None else None,
+                 fingerprint, time.time())
+            )
+            self._db.executemany(
+                "INSERT INTO buckets (band, bucket, doc_id) VALUES (?, ?, ?)",
+                [(band, bucket, doc_id) for band, bucket in self._buckets(signature)]
+            )
+            self._db.commit()
+        return signature
+
+    def query(self, text=None, signature=None, threshold=None, limit=5, exclude=None):
+        """Return up to ``limit`` ``(doc_id, similarity)`` pairs, most similar first."""
+        if signature is None:
+            signature = self.hasher.signature(text)
+        threshold = self.threshold if threshold is None else threshold
+        with self._lock:
+            candidates = set()
+            for band, bucket in self._buckets(signature):
+                candidates.update(doc_id for (doc_id,) in self._db.execute(
+                    "SELECT doc_id FROM buckets WHERE band = ? AND bucket = ?", (band, bucket)))
+            candidates.discard(exclude)
+
+            matches = []
+            for doc_id in candidates:
+                row = self._db.execute("SELECT signature FROM docs WHERE doc_id = ?", (doc_id,)).fetchone()
+                if row is None:
+                    continue
+                score = similarity(signature, np.frombuffer(row[0], dtype=np.uint32))
+                if score >= threshold:
+                    matches.append((doc_id, score))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit]
+
+    def get(self, doc_id):
+        """Return ``{'info', 'result', 'fingerprint'}`` stored for a document, or None."""
+        with self._lock:
+            row = self._db.execute("SELECT info, result, fingerprint FROM docs WHERE doc_id = ?",
+                                   (doc_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'info': json.loads(row[0]) if row[0] else None,
+            'result': json.loads(row[1]) if row[1] else None,
+            'fingerprint': row[2],
+        }
+
+    def best_result(self, text=None, signature=None, fingerprint=None):
+        """Most similar stored document whose result came from the same parser fingerprint.
+
+        Returns ``(doc_id, similarity, result)`` or None.
+        """
+        for doc_id, score in self.query(text, signature=signature, limit=10):
+            stored = self.get(doc_id)
+            if stored and stored['result'] is not None and stored['fingerprint'] == fingerprint:
+                return doc_id, score, stored['result']
+        return None
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._db.execute("DELETE FROM buckets WHERE doc_id = ?", (doc_id,))
+            self._db.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def diff_results(old, new):
+    """Field-by-field differences between two parse results.
+
+    List fields report ``added``/``removed`` items (compared case-insensitively);
+    other fields report ``old``/``new`` values. Unchanged fields are omitted.
+    """
+    changes = {}
+    for field in sorted(set(old or {}) | set(new or {})):
+        before, after = (old or {}).get(field), (new or {}).get(field)
+        if isinstance(before, list) or isinstance(after, list):
+            before_keys = {str(v).lower(): v for v in before or []}
+            after_keys = {str(v).lower(): v for v in after or []}
+            added = [after_keys[k] for k in after_keys if k not in before_keys]
+            removed = [before_keys[k] for k in before_keys if k not in after_keys]
+            if added or removed:
+                changes[field] = {'added': added, 'removed': removed}
+        elif before != after:
+            changes[field] = {'old': before, 'new': after}
+    return changes
+
+
+def dedupe_report(paths, extract_text, index):
+    """Group a corpus into near-duplicate clusters.
+
+    ``extract_text`` maps a path to its text. Each file is compared with
+    everything inserted before it, then inserted itself, so the index can
+    be a persistent one that later runs keep extending, including the
+    parser's ``--near-dup`` index: stored results are left untouched, and a
+    file whose exact text is already indexed is reported at similarity 1.0.
+    """
+    parent = {}
+
+    def find(node):
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    pairs = []
+    path_of = {}
+    failed = []
+    for path in paths:
+        try:
+            text = extract_text(path)
+        except Exception as e:
+            failed.append({'path': path, 'error': str(e)})
+            continue
+        if not text:
+            failed.append({'path': path, 'error': "Could not extract text from file"})
+            continue
+        find(path)
+        doc_id = text_id(text)
+        if doc_id in path_of:
+            # Identical text under another file name
+            pairs.append({'a': path, 'b': path_of[doc_id], 'similarity': 1.0})
+            parent[find(path)] = find(path_of[doc_id])
+            continue
+
+        # Documents from earlier runs are named by the path they were indexed under
+        earlier = lambda other: ((index.get(other) or {}).get('info') or {}).get('path') or other
+        if index.get(doc_id) is not None:
+            # Same text indexed by an earlier run (or by the parser)
+            other_path = earlier(doc_id)
+            if other_path != path:
+                pairs.append({'a': path, 'b': other_path, 'similarity': 1.0})
+                parent[find(path)] = find(other_path)
+
+        signature = index.hasher.signature(text)
+        for other, score in index.query(signature=signature, exclude=doc_id):
+            other_path = path_of.get(other) or earlier(other)
+            if other_path == path:
+                # An older version of this same file
+                continue
+            pairs.append({'a': path, 'b': other_path, 'similarity': round(score, 4)})
+            parent[find(path)] = find(other_path)
+        index.insert(doc_id, signature=signature, info={'path': path})
+        path_of[doc_id] = path
+
+    groups = {}
+    for node in list(parent):
+        groups.setdefault(find(node), []).append(node)
+    clusters = sorted((sorted(members) for members in groups.values() if len(members) > 1),
+                      key=lambda members: (-len(members), members[0]))
+    return {
+        'files': len(paths),
+        'failed': failed,
+        'groups': clusters,
+        'redundant': sum(len(members) - 1 for members in clusters),
+        'pairs': pairs,
+    }
+
+
+def main():
+    """Report near-duplicate resumes in a directory or glob."""
+    arg_parser = argparse.ArgumentParser(description="Near-duplicate resume report")
+    arg_parser.add_argument('target', help="Directory of resumes or a glob such as 'resumes/**/*.pdf'")
+    arg_parser.add_argument('--index', default=":memory:",
+                            help="SQLite index to compare against and extend (default: in-memory)")
+    arg_parser.add_argument('--threshold', type=float, default=0.8, help="Estimated Jaccard similarity")
+    arg_parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    args = arg_parser.parse_args()
+
+    from batch_parse import collect_paths
+    from resume import ImprovedResumeParser
+
+    paths = collect_paths(args.target)
+    if not paths:
+        print(f"❌ No resumes found for: {args.target}", file=sys.stderr)
+        sys.exit(1)
+
+    # Only text extraction is needed, so skip SkillNER and keep progress off stdout
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    parser = ImprovedResumeParser(fast_start=True, quiet=True, skillner=False)
+    index = NearDupIndex(args.index, threshold=args.threshold)
+    started = time.perf_counter()
+    report = dedupe_report(paths, parser.extract_text_from_pdf, index)
+    index.close()
+
+    print(f"✅ {report['files']} files, {len(report['groups'])} near-duplicate groups, "
+          f"{report['redundant']} redundant parses in {time.perf_counter() - started:.1f}s")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    else:
+        stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def content_key(file_bytes, fingerprint):
+    """Cache key for a resume: hash of its bytes plus the parser/skills fingerprint."""
+    digest = hashlib.sha256(file_bytes)
+    digest.update(b"\0")
+    digest.update(fingerprint.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Content-addressed cache of parse results.
+
+    A small in-process LRU sits in front of a SQLite file. The file is kept
+    under ``max_bytes`` by evicting the least recently used entries.
+    """
+
+    def __init__(self, path="parse_cache.sqlite", max_bytes=256 * 1024 * 1024, memory_items=256):
+        """Open (or create) the on-disk store."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # Several worker processes may share one cache file
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)")
+        self._db.commit()
+        self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def _remember(self, key, results):
+        self._memory[key] = results
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return a copy of the cached results for ``key``, or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats['hits'] += 1
+                self.stats['memory_hits'] += 1
+                return json.loads(json.dumps(self._memory[key]))
+
+            row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+
+            self._db.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            results = json.loads(row[0])
+            self._remember(key, results)
+            self.stats['hits'] += 1
+            self.stats['disk_hits'] += 1
+            return json.loads(row[0])
+
+    def put(self, key, results):
+        """Store results under ``key`` and evict old entries if over budget."""
+        value = json.dumps(results)
+        size = len(key) + len(value)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time())
+            )
+            # Re-read the total: other processes may be writing to the same file
+            self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            self.stats['stores'] += 1
+            self._remember(key, json.loads(value))
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        while self._size > self.max_bytes:
+            row = self._db.execute(
+                "SELECT key, size FROM results ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            key, size = row
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._memory.pop(key, None)
+            self._size -= size
+            self.stats['evictions'] += 1
+
+    def clear(self):
+        """Drop every cached result."""
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+            self._db.commit()
+            self._memory.clear()
+            self._size = 0
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def report(self):
+        """Return hit/miss counters and current store size."""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return dict(
+                self.stats,
+                hit_rate=round(self.stats['hits'] / lookups, 4) if lookups else 0.0,
+                bytes=self._size,
+                max_bytes=self.max_bytes,
+            )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
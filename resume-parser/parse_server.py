@@ -0,0 +1,202 @@
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import socketserver
+from concurrent.futures import ThreadPoolExecutor
+
+from resume import ImprovedResumeParser, result_dict
+from parse_cache import ParseCache
+
+
+class ParseService:
+    """Keeps one preloaded parser around and answers parse/health requests."""
+
+    def __init__(self, workers=4, fast_start=False, cache_path=None, near_dup_path=None, low_memory=False,
+                 deadline=None):
+        """Load the parser once and prepare the worker slots.
+
+        ``deadline`` is the default per-request parse deadline in seconds; a
+        request can override it and pass stage ``budgets`` of its own.
+        """
+        self.deadline = deadline
+        self.started_at = time.time()
+        self.ready = False
+        self.workers = workers
+        cache = ParseCache(cache_path) if cache_path else None
+        near_dup = None
+        if near_dup_path:
+            from near_dup import NearDupIndex
+            near_dup = NearDupIndex(near_dup_path)
+        self.parser = ImprovedResumeParser(fast_start=fast_start, cache=cache, near_dup=near_dup,
+                                           low_memory=low_memory)
+        self.slots = threading.BoundedSemaphore(workers)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.served = 0
+        self.failed = 0
+        self.ready = True
+
+    def health(self):
+        """Return a readiness/liveness snapshot."""
+        with self.lock:
+            health = {
+                'status': 'ready' if self.ready else 'starting',
+                'uptime': round(time.time() - self.started_at, 3),
+                'workers': self.workers,
+                'in_flight': self.in_flight,
+                'served': self.served,
+                'failed': self.failed,
+                'pid': os.getpid(),
+            }
+        if self.ready:
+            health['memory'] = self.parser.memory_report()
+        if self.ready and self.parser.cache is not None:
+            health['cache'] = self.parser.cache.report()
+        return health
+
+    def handle(self, request):
+        """Answer a single decoded request and return the response dict."""
+        request_id = request.get('id')
+        op = request.get('op', 'parse')
+
+        if op in ('health', 'ready'):
+            return {'id': request_id, 'ok': True, 'result': self.health()}
+
+        if op == 'metrics':
+            metrics = self.parser.metrics
+            if request.get('format') == 'prometheus':
+                return {'id': request_id, 'ok': True, 'result': metrics.to_prometheus()}
+            return {'id': request_id, 'ok': True, 'result': metrics.snapshot()}
+
+        if op != 'parse':
+            return {'id': request_id, 'ok': False, 'error': f"Unknown op: {op}"}
+
+        path = request.get('path')
+        if not path:
+            return {'id': request_id, 'ok': False, 'error': "Missing 'path'"}
+
+        with self.slots:
+            with self.lock:
+                self.in_flight += 1
+            started = time.perf_counter()
+            try:
+                results = self.parser.parse_resume(path, deadline=request.get('deadline', self.deadline),
+                                                   budgets=request.get('budgets'))
+            except Exception as e:
+                results = None
+                error = str(e)
+            else:
+                error = None if results else "Could not parse resume"
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+
+        elapsed = round(time.perf_counter() - started, 4)
+        with self.lock:
+            if error:
+                self.failed += 1
+            else:
+                self.served += 1
+
+        if error:
+            return {'id': request_id, 'ok': False, 'error': error, 'elapsed': elapsed}
+        return {'id': request_id, 'ok': True, 'result': result_dict(results), 'elapsed': elapsed}
+
+    def handle_line(self, line):
+        """Decode one JSON line, answer it and encode the response."""
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+        except ValueError as e:
+            response = {'id': None, 'ok': False, 'error': f"Bad request: {e}"}
+        else:
+            response = self.handle(request)
+        return json.dumps(response) + "\n"
+
+
+class _LineHandler(socketserver.StreamRequestHandler):
+    """Reads JSON lines from a socket client and writes a response per line."""
+
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode('utf-8').strip()
+            if not line:
+                continue
+            self.wfile.write(self.server.service.handle_line(line).encode('utf-8'))
+            self.wfile.flush()
+
+
+class _ThreadedUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve_unix(service, socket_path):
+    """Serve JSON-lines requests on a Unix socket until interrupted."""
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    with _ThreadedUnixServer(socket_path, _LineHandler) as server:
+        server.service = service
+        print(f"✅ Resume parser listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def serve_stdio(service, out):
+    """Serve JSON-lines requests from stdin, writing responses to ``out``."""
+    write_lock = threading.Lock()
+
+    def respond(line):
+        response = service.handle_line(line)
+        with write_lock:
+            out.write(response)
+            out.flush()
+
+    with write_lock:
+        out.write(json.dumps({'event': 'ready', 'result': service.health()}) + "\n")
+        out.flush()
+
+    with ThreadPoolExecutor(max_workers=service.workers) as pool:
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                pool.submit(respond, line)
+
+
+def main():
+    """Start the long-lived parser in socket or stdio mode."""
+    arg_parser = argparse.ArgumentParser(description="Long-lived resume parsing service")
+    arg_parser.add_argument('--socket', help="Unix socket path (default: JSON lines on stdin/stdout)")
+    arg_parser.add_argument('--workers', type=int, default=4, help="Concurrent parse requests")
+    arg_parser.add_argument('--fast-start', action='store_true', help="Trimmed spaCy pipeline and lazy SkillNER")
+    arg_parser.add_argument('--cache', help="SQLite parse cache file")
+    arg_parser.add_argument('--near-dup', help="SQLite near-duplicate index; reuse skills of similar resumes")
+    arg_parser.add_argument('--low-memory', action='store_true',
+                            help="Trimmed spaCy pipeline, fewer SkillNER matchers, compact results")
+    arg_parser.add_argument('--deadline', type=float,
+                            help="Default per-request deadline in seconds; slow stages degrade instead of failing")
+    args = arg_parser.parse_args()
+
+    # Keep stdout clean for responses; parser progress goes to stderr
+    out = sys.stdout
+    sys.stdout = sys.stderr
+
+    service = ParseService(workers=args.workers, fast_start=args.fast_start, cache_path=args.cache,
+                           near_dup_path=args.near_dup, low_memory=args.low_memory, deadline=args.deadline)
+
+    if args.socket:
+        serve_unix(service, args.socket)
+    else:
+        serve_stdio(service, out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+import os
+import sys
+import json
+import time
+import uuid
+import signal
+import asyncio
+import argparse
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+from resume import ImprovedResumeParser
+from parse_cache import ParseCache
+
+# Errors worth retrying a Redis write for; redis-py's own types join when it is installed
+TRANSIENT_ERRORS = (ConnectionError, OSError, asyncio.TimeoutError)
+try:
+    from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+    TRANSIENT_ERRORS += (RedisConnectionError, RedisTimeoutError)
+except ImportError:
+    pass
+
+
+def connect(url):
+    """Open an asyncio Redis client; ``fakeredis://`` gives an in-process stand-in."""
+    if url.startswith("fakeredis://"):
+        import fakeredis
+        return fakeredis.FakeAsyncRedis(decode_responses=True)
+    import redis.asyncio as aioredis
+    return aioredis.from_url(url, decode_responses=True)
+
+
+class QueueKeys:
+    """Redis key layout shared with the Node producer (server/src/queues/resumeQueue.js)."""
+
+    def __init__(self, prefix="resume-parse"):
+        self.jobs = f"{prefix}:jobs"            # list: producers LPUSH, workers pop from the right
+        self.delayed = f"{prefix}:delayed"      # zset: retries, scored by the time they are due
+        self.done = f"{prefix}:done"            # list: ids of finished jobs, for consumers to pick up
+        self.failed = f"{prefix}:failed"        # list: jobs that ran out of attempts
+        self.result_prefix = f"{prefix}:result:"
+        self.processing_prefix = f"{prefix}:processing:"
+        self.heartbeat_prefix = f"{prefix}:heartbeat:"  # string with a TTL: the worker is alive
+
+    def result(self, job_id):
+        return self.result_prefix + str(job_id)
+
+    def processing(self, worker_id):
+        return self.processing_prefix + worker_id
+
+    def heartbeat(self, worker_id):
+        return self.heartbeat_prefix + worker_id
+
+
+class QueueWorker:
+    """Pulls parse jobs from a Redis list and runs them on a preloaded parser.
+
+    At most ``concurrency`` jobs are in flight: the worker only pops a new
+    job once a slot is free, so a slow parser leaves work queued in Redis
+    rather than piling it up in memory. Each popped job is moved atomically
+    onto this worker's processing list and only removed after its result is
+    written. Each worker refreshes a heartbeat key while it runs; any worker
+    requeues the processing list of one whose heartbeat has expired, so jobs
+    from a crashed worker are recovered even if it never comes back with the
+    same ``worker_id``. Failed parses are retried with exponential backoff up
+    to ``max_attempts``.
+    """
+
+    def __init__(self, redis, parser, prefix="resume-parse", concurrency=4, max_attempts=3,
+                 retry_delay=2.0, result_ttl=24 * 3600, worker_id=None, poll_timeout=1,
+                 heartbeat_ttl=30):
+        self.redis = redis
+        self.parser = parser
+        self.keys = QueueKeys(prefix)
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.result_ttl = result_ttl
+        self.poll_timeout = poll_timeout
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.processing = self.keys.processing(self.worker_id)
+        self.heartbeat_ttl = heartbeat_ttl
+
+        self._slots = asyncio.Semaphore(concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._tasks = set()
+        self._stopping = asyncio.Event()
+        self.stats = {'processed': 0, 'failed': 0, 'retried': 0, 'reclaimed': 0}
+
+    @staticmethod
+    def encode_job(path, job_id=None, **extra):
+        """Build the JSON payload a producer pushes onto the jobs list."""
+        return json.dumps(dict(extra, id=job_id or uuid.uuid4().hex, path=path, attempts=0))
+
+    async def enqueue(self, path, job_id=None, **extra):
+        """Push a parse job (mainly for tests and tooling); returns its id."""
+        payload = self.encode_job(path, job_id, **extra)
+        await self.redis.lpush(self.keys.jobs, payload)
+        return json.loads(payload)['id']
+
+    async def _write(self, make_call, attempts=5):
+        """Run a Redis write, retrying transient connection errors with backoff."""
+        delay = 0.1
+        for attempt in range(attempts):
+            try:
+                return await make_call()
+            except TRANSIENT_ERRORS:
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def beat(self):
+        """Mark this worker alive for ``heartbeat_ttl`` seconds."""
+        await self.redis.set(self.keys.heartbeat(self.worker_id), time.time(), ex=self.heartbeat_ttl)
+
+    async def recover(self):
+        """Requeue jobs left on this worker's processing list by a previous run."""
+        recovered = 0
+        while await self.redis.rpoplpush(self.processing, self.keys.jobs):
+            recovered += 1
+        return recovered
+
+    async def reclaim_stale(self):
+        """Requeue the processing lists of workers whose heartbeat has expired."""
+        reclaimed = 0
+        async for key in self.redis.scan_iter(match=self.keys.processing_prefix + "*"):
+            worker_id = key[len(self.keys.processing_prefix):]
+            if worker_id == self.worker_id or await self.redis.exists(self.keys.heartbeat(worker_id)):
+                continue
+            # RPOPLPUSH is atomic, so two workers reclaiming the same list never duplicate a job
+            while await self.redis.rpoplpush(key, self.keys.jobs):
+                reclaimed += 1
+        self.stats['reclaimed'] += reclaimed
+        return reclaimed
+
+    async def promote_due_retries(self):
+        """Move retries whose backoff has elapsed back onto the jobs list."""
+        due = await self.redis.zrangebyscore(self.keys.delayed, 0, time.time())
+        for payload in due:
+            # Only the worker that wins the ZREM requeues it
+            if await self.redis.zrem(self.keys.delayed, payload):
+                await self.redis.lpush(self.keys.jobs, payload)
+        return len(due)
+
+    async def _scheduler(self):
+        last_reclaim = time.monotonic()
+        while not self._stopping.is_set():
+            try:
+                await self.beat()
+                await self.promote_due_retries()
+                if time.monotonic() - last_reclaim >= self.heartbeat_ttl:
+                    last_reclaim = time.monotonic()
+                    reclaimed = await self.reclaim_stale()
+                    if reclaimed:
+                        print(f"♻️ Requeued {reclaimed} jobs from stopped workers", file=sys.stderr)
+            except TRANSIENT_ERRORS as e:
+                # Try again next tick; the heartbeat TTL covers a few missed beats
+                print(f"⚠️ Scheduler Redis error: {e}", file=sys.stderr)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.retry_delay / 2 or 0.5)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _handle(self, payload):
+        try:
+            try:
+                job = json.loads(payload)
+                path = job['path']
+            except (ValueError, KeyError, TypeError) as e:
+                await self._finish(payload, {'id': None}, ok=False, error=f"Bad job payload: {e}")
+                return
+
+            loop = asyncio.get_running_loop()
+            try:
+                results = await loop.run_in_executor(self._executor, self.parser.parse_resume, path)
+                error = None if results else "Could not parse resume"
+            except Exception as e:
+                results, error = None, str(e)
+
+            if error is None:
+                await self._finish(payload, job, ok=True, result=results)
+            elif job.get('attempts', 0) + 1 < self.max_attempts:
+                await self._retry(payload, job, error)
+            else:
+                await self._finish(payload, job, ok=False, error=error)
+        finally:
+            self._slots.release()
+
+    async def _retry(self, payload, job, error):
+        job = dict(job, attempts=job.get('attempts', 0) + 1, last_error=error)
+        due = time.time() + self.retry_delay * 2 ** (job['attempts'] - 1)
+        await self._write(lambda: self.redis.zadd(self.keys.delayed, {json.dumps(job): due}))
+        await self._write(lambda: self.redis.lrem(self.processing, 1, payload))
+        self.stats['retried'] += 1
+
+    async def _finish(self, payload, job, ok, result=None, error=None):
+        record = {'id': job.get('id'), 'ok': ok, 'result': result, 'error': error,
+                  'attempts': job.get('attempts', 0) + 1, 'worker': self.worker_id,
+                  'finished_at': time.time()}
+        if job.get('id') is not None:
+            await self._write(lambda: self.redis.set(self.keys.result(job['id']), json.dumps(record),
+                                                     ex=self.result_ttl))
+            await self._write(lambda: self.redis.lpush(self.keys.done, job['id']))
+        if not ok:
+            await self._write(lambda: self.redis.lpush(self.keys.failed, json.dumps(dict(job, error=error))))
+        await self._write(lambda: self.redis.lrem(self.processing, 1, payload))
+        self.stats['processed' if ok else 'failed'] += 1
+
+    async def run(self, max_jobs=None, idle_exit=False):
+        """Process jobs until stop() is called.
+
+        ``max_jobs`` stops after that many pops; ``idle_exit`` stops once the
+        queue is empty and nothing is in flight (handy for tests and drains).
+        """
+        await self.beat()
+        recovered = await self.recover() + await self.reclaim_stale()
+        if recovered:
+            print(f"♻️ Requeued {recovered} unfinished jobs from a previous run", file=sys.stderr)
+        scheduler = asyncio.create_task(self._scheduler())
+        popped = 0
+        pop_delay = 0.1
+
+        try:
+            while not self._stopping.is_set() and (max_jobs is None or popped < max_jobs):
+                # Backpressure: wait for a free slot before taking more work from Redis
+                await self._slots.acquire()
+                try:
+                    payload = await self.redis.brpoplpush(self.keys.jobs, self.processing,
+                                                          timeout=self.poll_timeout)
+                except TRANSIENT_ERRORS as e:
+                    self._slots.release()
+                    print(f"⚠️ Redis error while waiting for jobs, retrying in {pop_delay:.1f}s: {e}",
+                          file=sys.stderr)
+                    await asyncio.sleep(pop_delay)
+                    pop_delay = min(pop_delay * 2, 5.0)
+                    continue
+                pop_delay = 0.1
+                if payload is None:
+                    self._slots.release()
+                    if (idle_exit and not self._tasks and not await self.redis.zcard(self.keys.delayed)
+                            and not await self.redis.llen(self.keys.jobs)):
+                        break
+                    continue
+                popped += 1
+                task = asyncio.create_task(self._handle(payload))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        finally:
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._stopping.set()
+            await scheduler
+            self._executor.shutdown(wait=True)
+            try:
+                # A clean exit leaves nothing to reclaim; let the key go now rather than at its TTL
+                await self.redis.delete(self.keys.heartbeat(self.worker_id))
+            except TRANSIENT_ERRORS:
+                pass
+
+    def stop(self):
+        """Stop taking new jobs; in-flight jobs are allowed to finish."""
+        self._stopping.set()
+
+
+async def _main(args):
+    redis = connect(args.redis_url)
+    cache = ParseCache(args.cache) if args.cache else None
+    parser = ImprovedResumeParser(fast_start=args.fast_start, cache=cache)
+    worker = QueueWorker(redis, parser, prefix=args.prefix, concurrency=args.concurrency,
+                         max_attempts=args.max_attempts, retry_delay=args.retry_delay,
+                         worker_id=args.worker_id, heartbeat_ttl=args.heartbeat_ttl)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    print(f"✅ Worker {worker.worker_id} consuming {worker.keys.jobs} "
+          f"(concurrency {args.concurrency})", file=sys.stderr)
+    await worker.run()
+    print(f"👋 Worker stopped: {worker.stats}", file=sys.stderr)
+
+
+def main():
+    """Run a resume parsing worker against a Redis list."""
+    arg_parser = argparse.ArgumentParser(description="Asynchronous resume parsing worker")
+    arg_parser.add_argument('--redis-url', default=os.environ.get('REDIS_URL', 'redis://localhost:6379'))
+    arg_parser.add_argument('--prefix', default="resume-parse", help="Redis key prefix")
+    arg_parser.add_argument('--worker-id', default=os.environ.get('RESUME_WORKER_ID'),
+                            help="Stable id, so a restarted worker requeues its own unfinished jobs "
+                                 "at once (default: hostname:pid)")
+    arg_parser.add_argument('--heartbeat-ttl', type=int, default=30,
+                            help="Seconds without a heartbeat before a worker's jobs are requeued")
+    arg_parser.add_argument('--concurrency', type=int, default=4)
+    arg_parser.add_argument('--max-attempts', type=int, default=3)
+    arg_parser.add_argument('--retry-delay', type=float, default=2.0, help="Base backoff in seconds")
+    arg_parser.add_argument('--fast-start', action='store_true')
+    arg_parser.add_argument('--cache', help="SQLite parse cache file")
+    args = arg_parser.parse_args()
+
+    # Parser progress goes to stderr so worker output stays readable
+    sys.stdout = sys.stderr
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,226 +1,687 @@
-import spacy
 import re
 import os
 import sys
+import time
+import json
+import hashlib
+import argparse
+import threading
 import subprocess
-from collections import Counter
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+
+from skill_matcher import SkillMatcher
+from field_rules import FieldRuleEngine, DEFAULT_RULES_PATH
+from metrics import Metrics, profile_call, rss_mb
+from skill_vocab import SkillVocab, DEFAULT_VOCAB_PATH
+from sections import SectionIndex
+from extractors import ExtractorRegistry, BACKENDS, load_ranking, DEFAULT_RANKING_PATH
+
+# Wall-clock seconds spent in each startup stage, filled in as they happen
+_module_started = time.perf_counter()
+STARTUP_TIMINGS = {}
+
+# Pipeline components the parser never reads: extract_name only needs NER and
+# SkillNER only matches on token text, so fast start loads the model without them
+UNUSED_SPACY_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+# SkillNER import result, resolved on first use by load_skillner()
+_skillner = None
+
+# Bump whenever extraction logic changes so cached parse results are invalidated
+PARSER_VERSION = "6"
+
+# Default bounds on PDF extraction; resumes past these limits are truncated
+MAX_PDF_PAGES = 50
+MAX_PDF_CHARS = 200000
+
+# SkillNER runs spaCy over its whole input, so it only sees this many characters
+MAX_NLP_CHARS = 100000
+
+# Name extraction runs NER over the header; a real header is a few short lines,
+# so this only bites on text that extracted as one huge line
+MAX_HEADER_CHARS = 1000
+
+# Timed-out SkillNER calls keep running in the background; past this many the
+# parser stops starting new ones until they finish
+MAX_SKILLNER_RUNAWAY = 2
+
+# SkillNER matcher groups a parser can load; annotate() runs all five stages
+SKILLNER_MATCHERS = {
+    'full': ('full_matcher', 'full_uni_matcher'),
+    'abbreviation': ('abv_matcher',),
+    'ngram': ('low_form_matcher', 'token_matcher'),
+}
+# The n-gram matchers hold a pattern per token and surface form of every skill
+LOW_MEMORY_MATCHERS = ('full', 'abbreviation')
+
+# Fallback technical skills database, also compiled into the skill vocabulary artifact.
+# Read-only and shared by every parser in the process.
+TECHNICAL_SKILLS = {
+    'programming_languages': [
+        'python', 'java', 'javascript', 'c++', 'c#', 'c', 'php', 'ruby', 'go', 'rust',
+        'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell',
+        'typescript', 'dart', 'objective-c', 'assembly', 'cobol', 'fortran', 'lua', 'groovy'
+    ],
+    'web_technologies': [
+        'html', 'css', 'javascript', 'typescript', 'react', 'angular', 'vue.js', 'vue',
+        'node.js', 'nodejs', 'express.js', 'express', 'django', 'flask', 'spring boot', 'spring',
+        'laravel', 'rails', 'ruby on rails', 'next.js', 'nuxt.js', 'gatsby', 'svelte',
+        'bootstrap', 'tailwind css', 'sass', 'scss', 'less', 'jquery', 'ajax', 'rest api',
+        'graphql', 'webpack', 'vite', 'gulp', 'grunt'
+    ],
+    'databases': [
+        'mysql', 'postgresql', 'postgres', 'mongodb', 'sqlite', 'redis', 'oracle',
+        'sql server', 'microsoft sql server', 'elasticsearch', 'cassandra', 'dynamodb',
+        'neo4j', 'couchdb', 'firebase', 'mariadb', 'influxdb', 'clickhouse'
+    ],
+    'cloud_devops': [
+        'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp', 'google cloud',
+        'docker', 'kubernetes', 'jenkins', 'git', 'gitlab', 'github', 'ci/cd', 'terraform',
+        'ansible', 'puppet', 'chef', 'vagrant', 'helm', 'istio', 'nginx', 'apache',
+        'linux', 'unix', 'ubuntu', 'centos', 'debian', 'redhat'
+    ],
+    'data_science': [
+        'machine learning', 'deep learning', 'artificial intelligence', 'data science',
+        'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'scikit-learn', 'sklearn',
+        'matplotlib', 'seaborn', 'plotly', 'jupyter', 'anaconda', 'spark', 'hadoop',
+        'tableau', 'power bi', 'excel', 'statistics', 'data analysis', 'data visualization'
+    ],
+    'mobile_development': [
+        'android', 'ios', 'react native', 'flutter', 'xamarin', 'cordova', 'phonegap',
+        'ionic', 'swift', 'objective-c', 'kotlin', 'java'
+    ],
+    'testing_tools': [
+        'selenium', 'junit', 'testng', 'pytest', 'jest', 'mocha', 'cypress', 'cucumber',
+        'postman', 'soap ui', 'jmeter', 'loadrunner'
+    ],
+    'other_tools': [
+        'jira', 'confluence', 'slack', 'trello', 'asana', 'photoshop', 'illustrator',
+        'figma', 'sketch', 'zeplin', 'invision', 'adobe xd', 'canva'
+    ]
+}
+TECHNICAL_SKILLS = MappingProxyType({category: tuple(skills) for category, skills in TECHNICAL_SKILLS.items()})
+ALL_SKILLS = tuple(sorted({skill.lower() for skills in TECHNICAL_SKILLS.values() for skill in skills}))
+
+# Compiled fallback matcher, built by shared_skill_matcher() on first use
+_skill_matcher = None
+
+
+def shared_skill_matcher():
+    """The process-wide SkillMatcher over TECHNICAL_SKILLS."""
+    global _skill_matcher
+    if _skill_matcher is None:
+        _skill_matcher = SkillMatcher(TECHNICAL_SKILLS)
+    return _skill_matcher
+
+# Progress messages go through log(); quiet mode leaves only the results on stdout
+QUIET = False
+
+def set_quiet(quiet=True):
+    """Turn progress logging off (or back on) for the whole process."""
+    global QUIET
+    QUIET = quiet
+
+def log(message=""):
+    """Print a progress message unless quiet mode is on."""
+    if not QUIET:
+        print(message)
 
 def install_package(package):
     """Install package if not available."""
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        print(f"✅ {package} installed successfully")
+        log(f"✅ {package} installed successfully")
     except Exception as e:
-        print(f"❌ Failed to install {package}: {e}")
-
-# Install SkillNER and its dependencies for advanced skills extraction
-try:
-    from skillNer.general_params import SKILL_DB
-    from skillNer.skill_extractor_class import SkillExtractor
-    print("✅ SkillNER already installed")
-    SKILLNER_AVAILABLE = True
-except ImportError as e:
-    print(f"📦 Installing SkillNER and dependencies...")
+        log(f"❌ Failed to install {package}: {e}")
+
+def load_skillner(auto_install=True):
+    """Import SkillNER on first use; returns (SKILL_DB, SkillExtractor) or (None, None)."""
+    global _skillner
+    if _skillner is not None:
+        return _skillner
+    
+    started = time.perf_counter()
     try:
-        # Install required dependencies first
-        install_package("ipython")
-        install_package("jupyter")
-        install_package("skillNer")
-        
-        # Try importing again
         from skillNer.general_params import SKILL_DB
         from skillNer.skill_extractor_class import SkillExtractor
-        print("✅ SkillNER installed successfully")
-        SKILLNER_AVAILABLE = True
-    except Exception as install_error:
-        print(f"⚠️ SkillNER installation failed: {install_error}")
-        print("📝 Will use manual skills extraction instead")
-        SKILLNER_AVAILABLE = False
-        SKILL_DB = None
-        SkillExtractor = None
-
-def setup_spacy():
-    """Setup spaCy and required models."""
+        log("✅ SkillNER already installed")
+        _skillner = (SKILL_DB, SkillExtractor)
+    except ImportError:
+        if not auto_install:
+            log("📝 SkillNER not installed, will use manual skills extraction")
+            _skillner = (None, None)
+        else:
+            log(f"📦 Installing SkillNER and dependencies...")
+            try:
+                # Install required dependencies first
+                install_package("ipython")
+                install_package("jupyter")
+                install_package("skillNer")
+                
+                # Try importing again
+                from skillNer.general_params import SKILL_DB
+                from skillNer.skill_extractor_class import SkillExtractor
+                log("✅ SkillNER installed successfully")
+                _skillner = (SKILL_DB, SkillExtractor)
+            except Exception as install_error:
+                log(f"⚠️ SkillNER installation failed: {install_error}")
+                log("📝 Will use manual skills extraction instead")
+                _skillner = (None, None)
+    except Exception as e:
+        # Importing skillNer downloads SKILL_DB, so network and data errors surface here
+        log(f"⚠️ SkillNER failed to load: {e}")
+        log("📝 Will use manual skills extraction instead")
+        _skillner = (None, None)
+    
+    STARTUP_TIMINGS['skillner_import'] = time.perf_counter() - started
+    return _skillner
+
+def setup_spacy(exclude=None, auto_install=True):
+    """Setup spaCy and required models, optionally skipping pipeline components."""
+    started = time.perf_counter()
+    exclude = exclude or []
     try:
         import spacy
         try:
-            nlp = spacy.load("en_core_web_sm")
-            print("✅ spaCy model loaded successfully")
-            return nlp
+            nlp = spacy.load("en_core_web_sm", exclude=exclude)
+            log("✅ spaCy model loaded successfully")
         except OSError:
-            print("📦 Installing spaCy English model...")
+            if not auto_install:
+                raise
+            log("📦 Installing spaCy English model...")
             subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-            nlp = spacy.load("en_core_web_sm")
-            return nlp
+            nlp = spacy.load("en_core_web_sm", exclude=exclude)
     except ImportError:
-        print("📦 Installing spaCy...")
+        if not auto_install:
+            raise
+        log("📦 Installing spaCy...")
         install_package("spacy")
         subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
         import spacy
-        return spacy.load("en_core_web_sm")
+        nlp = spacy.load("en_core_web_sm", exclude=exclude)
+    
+    STARTUP_TIMINGS['spacy_load'] = time.perf_counter() - started
+    return nlp
+
+def load_pypdf2(auto_install=True):
+    """Import PyPDF2 on first use."""
+    try:
+        import PyPDF2
+    except ImportError:
+        if not auto_install:
+            raise
+        log("📦 Installing PyPDF2...")
+        install_package("PyPDF2")
+        import PyPDF2
+    return PyPDF2
+
+STARTUP_TIMINGS['module_import'] = time.perf_counter() - _module_started
+
+class ResumeText:
+    """Views of one resume's text that extractors read, each built at most once.
+    
+    ``text`` is the raw string and ``sections`` its SectionIndex, split once.
+    ``header_doc`` runs spaCy over the header section only (at most
+    ``header_lines`` lines and ``header_chars`` characters), and ``doc``
+    tokenizes the full text. The spaCy
+    views are computed on first access, so unused ones cost nothing.
+    """
+    
+    def __init__(self, text, nlp, header_lines=5, deadline=None, header_chars=MAX_HEADER_CHARS):
+        self.text = text
+        self.nlp = nlp
+        # Optional Deadline whose budgets the extractors honour
+        self.deadline = deadline
+        self.sections = SectionIndex(text, header_lines)
+        self.lines = [line[:header_chars] for line in self.sections.header_lines(header_lines)]
+        self.header_text = ' '.join(self.lines)[:header_chars]
+        self._header_doc = None
+        self._doc = None
+        # Filled once by ImprovedResumeParser.scan_fields
+        self.field_matches = None
+    
+    @property
+    def header_doc(self):
+        if self._header_doc is None:
+            self._header_doc = self.nlp(self.header_text)
+        return self._header_doc
+    
+    @header_doc.setter
+    def header_doc(self, doc):
+        self._header_doc = doc
+    
+    @property
+    def doc(self):
+        if self._doc is None:
+            self._doc = self.nlp(self.text)
+        return self._doc
+    
+    @doc.setter
+    def doc(self, doc):
+        self._doc = doc
+
+
+class Deadline:
+    """Overall time limit for one parse plus optional per-stage budgets.
+    
+    ``seconds`` counts from creation; ``budgets`` maps a stage name such as
+    ``'pdf_extract'`` or ``'skillner'`` to the most seconds it may take. Stages
+    that give up early to stay inside their budget are listed in ``degraded``.
+    """
+    
+    def __init__(self, seconds=None, budgets=None):
+        self.expires = time.perf_counter() + seconds if seconds is not None else None
+        self.budgets = dict(budgets or {})
+        self.degraded = []
+    
+    def remaining(self):
+        """Seconds left overall, or None without an overall deadline."""
+        if self.expires is None:
+            return None
+        return max(0.0, self.expires - time.perf_counter())
+    
+    def budget(self, stage):
+        """Seconds ``stage`` may take from now, or None if it is unbounded."""
+        limits = [limit for limit in (self.budgets.get(stage), self.remaining()) if limit is not None]
+        return min(limits) if limits else None
+    
+    def degrade(self, stage):
+        if stage not in self.degraded:
+            self.degraded.append(stage)
+
+
+class ParseResult:
+    """Slotted parse result for low-memory mode.
+    
+    Reads like the result dict (``result['skills']``, ``.get()``, ``.keys()``)
+    at a fraction of its size; ``to_dict()`` gives the plain dict for JSON.
+    """
+    
+    FIELDS = ('first_name', 'last_name', 'email', 'phone', 'skills', 'exp_years')
+    # Keys only present in the dict when a parse fills them in
+    OPTIONAL = ('skill_sections', 'degraded')
+    __slots__ = FIELDS + OPTIONAL
+    
+    def __init__(self, first_name=None, last_name=None, email=None, phone=None, skills=(), exp_years=None,
+                 skill_sections=None, degraded=()):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.email = email
+        self.phone = phone
+        self.skills = tuple(skills or ())
+        self.exp_years = exp_years
+        self.skill_sections = skill_sections
+        self.degraded = tuple(degraded or ())
+    
+    def __getitem__(self, key):
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key):
+        return key in self.keys()
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __eq__(self, other):
+        if isinstance(other, ParseResult):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"ParseResult({self.to_dict()!r})"
+    
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.keys() else default
+    
+    def keys(self):
+        return self.FIELDS + tuple(key for key in self.OPTIONAL if getattr(self, key))
+    
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+    
+    def to_dict(self):
+        results = {key: getattr(self, key) for key in self.FIELDS}
+        results['skills'] = list(self.skills)
+        if self.skill_sections:
+            results['skill_sections'] = self.skill_sections
+        if self.degraded:
+            results['degraded'] = list(self.degraded)
+        return results
+
+
+def result_dict(results):
+    """Plain dict for a parse result of either kind (None stays None)."""
+    return results.to_dict() if isinstance(results, ParseResult) else results
 
-try:
-    import PyPDF2
-except ImportError:
-    print("📦 Installing PyPDF2...")
-    install_package("PyPDF2")
-    import PyPDF2
 
 class ImprovedResumeParser:
     """Improved Resume parser with accurate field extraction using SkillNER."""
     
-    def __init__(self):
-        """Initialize the parser with spaCy model and SkillNER."""
-        print("🚀 Initializing Improved Resume Parser with SkillNER...")
-        self.nlp = setup_spacy()
+    # Input each extractor reads: 'text' (raw string), 'header' (spaCy over the
+    # first lines) or 'doc' (the full spaCy doc). Only inputs some extractor
+    # declares are ever computed, and batch parsing pipes exactly those.
+    EXTRACTOR_INPUTS = {
+        'extract_name': 'header',
+        'extract_contact_info': 'text',
+        'extract_skills_accurately': 'text',
+        'extract_experience_years': 'text',
+    }
+    
+    def __init__(self, fast_start=False, cache=None, max_pages=MAX_PDF_PAGES, max_chars=MAX_PDF_CHARS,
+                 max_nlp_chars=MAX_NLP_CHARS,
+                 rules_path=DEFAULT_RULES_PATH, quiet=False, metrics=None, vocab_path=DEFAULT_VOCAB_PATH,
+                 skillner=True, near_dup=None, low_memory=False, matchers=None, compact_results=None,
+                 section_workers=1, skill_sections=False, extractor=None, extractor_ranking=DEFAULT_RANKING_PATH,
+                 nlp=None):
+        """Initialize the parser with spaCy model and SkillNER.
+        
+        With ``fast_start`` the spaCy model is loaded without the components the
+        parser never uses, SkillNER is only imported and built on the first skills
+        extraction, and missing packages are never installed with pip. Without it
+        the constructor installs a missing spaCy, spaCy model or SkillNER with pip.
+        ``cache`` is an optional ``parse_cache.ParseCache`` consulted by parse_resume.
+        ``max_pages``/``max_chars`` bound PDF extraction (0 or None for no limit).
+        ``max_nlp_chars`` bounds the text SkillNER annotates.
+        ``rules_path`` is the JSON file of contact/experience field rules.
+        ``quiet`` silences progress logging; per-stage timings and counters are
+        always recorded in ``metrics`` (a ``metrics.Metrics``, created if omitted).
+        ``vocab_path`` is the memory-mapped skill vocabulary built by skill_vocab.py;
+        when present its token weights rescale SkillNER's n-gram match scores.
+        ``skillner=False`` never loads SkillNER and always uses the compiled matcher.
+        ``near_dup`` is an optional ``near_dup.NearDupIndex``: a resume whose text is
+        a near-duplicate of one parsed before reuses that resume's skills.
+        ``low_memory`` trims the spaCy pipeline as fast start does, loads only the
+        ``LOW_MEMORY_MATCHERS`` SkillNER matchers and returns ``ParseResult``
+        objects. ``matchers`` picks SkillNER matcher groups explicitly (keys of
+        ``SKILLNER_MATCHERS``) and ``compact_results`` the result type.
+        ``section_workers`` > 1 annotates resume sections with SkillNER in
+        parallel threads; ``skill_sections`` adds ``{section: [skills]}`` to results.
+        ``extractor`` names a text extraction backend to prefer (see extractors.py);
+        otherwise each file gets the best installed backend for its type, ranked by
+        ``extractor_ranking`` (a JSON file written by benchmark.py) or the default order.
+        ``nlp`` is an already loaded spaCy pipeline to use instead of ``en_core_web_sm``,
+        e.g. ``spacy.blank('en')`` when only the compiled skill matcher is needed.
+        """
+        if quiet:
+            set_quiet(True)
+        self.metrics = metrics if metrics is not None else Metrics()
+        started = time.perf_counter()
+        self.memory = {'rss_before_mb': rss_mb()}
+        log("🚀 Initializing Improved Resume Parser with SkillNER...")
+        self.fast_start = fast_start
+        self.cache = cache
+        self.near_dup = near_dup
+        self._fingerprint = None
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.max_nlp_chars = max_nlp_chars
+        self.auto_install = not fast_start
+        self.extractors = ExtractorRegistry(load_ranking(extractor_ranking), prefer=extractor,
+                                            pypdf2_loader=lambda: load_pypdf2(auto_install=self.auto_install))
+        self.low_memory = low_memory
+        if matchers is None:
+            matchers = LOW_MEMORY_MATCHERS if low_memory else tuple(SKILLNER_MATCHERS)
+        unknown = set(matchers) - set(SKILLNER_MATCHERS)
+        if unknown:
+            raise ValueError(f"Unknown SkillNER matchers: {', '.join(sorted(unknown))}")
+        self.matchers = tuple(name for name in SKILLNER_MATCHERS if name in matchers)
+        self.compact_results = low_memory if compact_results is None else compact_results
+        self.section_workers = section_workers
+        self.skill_sections = skill_sections
+        self._section_pool = None
+        self.nlp = nlp if nlp is not None else setup_spacy(
+            exclude=UNUSED_SPACY_COMPONENTS if fast_start or low_memory else None,
+            auto_install=self.auto_install
+        )
+        
+        self.skill_extractor = None
+        self.use_skillner = False
+        self._skillner_pending = True
+        self._skillner_lock = threading.Lock()
+        # Seconds per character of SkillNER input (moving average) and abandoned calls
+        self._skillner_rate = None
+        self._skillner_runaway = 0
+        self._runaway_lock = threading.Lock()
+        if not skillner:
+            self._skillner_pending = False
+            log("📝 SkillNER disabled, using manual skills extraction")
+        elif fast_start:
+            log("⏳ Deferring SkillNER setup until first skills extraction")
+        else:
+            self.init_skillner()
+        
+        # Fallback skills tables are shared, not copied per parser; their compiled
+        # matcher is built on first use (see skill_matcher below)
+        self.technical_skills = TECHNICAL_SKILLS
+        self.all_skills = ALL_SKILLS
+        
+        # Contact and experience rules, each pattern compiled once
+        with open(rules_path, 'r', encoding='utf-8') as file:
+            self.field_rules_config = json.load(file)
+        self.field_rules = FieldRuleEngine(self.field_rules_config['rules'])
+        
+        # Shared, memory-mapped vocabulary artifact (optional build output)
+        self.vocab = SkillVocab(vocab_path) if vocab_path and os.path.exists(vocab_path) else None
+        if self.vocab is not None:
+            log(f"✅ Skill vocabulary mapped: {len(self.vocab)} skills")
+        
+        STARTUP_TIMINGS['parser_init'] = time.perf_counter() - started
+        self.memory['rss_after_init_mb'] = rss_mb()
+        log(f"✅ Parser initialized successfully")
+    
+    @property
+    def skill_matcher(self):
+        """The shared compiled matcher over TECHNICAL_SKILLS, built on first use."""
+        return shared_skill_matcher()
+    
+    def init_skillner(self):
+        """Import SkillNER and build its matchers (once)."""
+        if not self._skillner_pending:
+            return
+        with self._skillner_lock:
+            if self._skillner_pending:
+                try:
+                    self._load_skill_extractor()
+                finally:
+                    # A failed setup is not retried on every document
+                    self._skillner_pending = False
+    
+    def _load_skill_extractor(self):
+        started = time.perf_counter()
+        rss_before = rss_mb()
+        SKILL_DB, SkillExtractor = load_skillner(auto_install=self.auto_install)
         
         # Initialize SkillNER for advanced skills extraction
-        if SKILLNER_AVAILABLE:
+        if SkillExtractor is not None:
             try:
-                print("🔧 Setting up SkillNER...")
+                log("🔧 Setting up SkillNER...")
                 # Import PhraseMatcher here to ensure it's available
                 from spacy.matcher import PhraseMatcher
-                self.skill_extractor = SkillExtractor(self.nlp, SKILL_DB, PhraseMatcher)
-                print("✅ SkillNER initialized successfully")
+                self.skill_extractor = self._build_skill_extractor(SkillExtractor, SKILL_DB, PhraseMatcher)
+                log(f"✅ SkillNER initialized successfully ({', '.join(self.matchers)} matchers)")
                 self.use_skillner = True
             except Exception as e:
-                print(f"⚠️ SkillNER initialization failed: {e}")
-                print("📝 Falling back to manual skills extraction")
+                log(f"⚠️ SkillNER initialization failed: {e}")
+                log("📝 Falling back to manual skills extraction")
                 self.skill_extractor = None
                 self.use_skillner = False
         else:
-            print("📝 SkillNER not available, using manual skills extraction")
-            self.skill_extractor = None
-            self.use_skillner = False
-            
-            # Fallback comprehensive technical skills database
-            self.technical_skills = {
-                'programming_languages': [
-                    'python', 'java', 'javascript', 'c++', 'c#', 'c', 'php', 'ruby', 'go', 'rust',
-                    'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell',
-                    'typescript', 'dart', 'objective-c', 'assembly', 'cobol', 'fortran', 'lua', 'groovy'
-                ],
-                'web_technologies': [
-                    'html', 'css', 'javascript', 'typescript', 'react', 'angular', 'vue.js', 'vue',
-                    'node.js', 'nodejs', 'express.js', 'express', 'django', 'flask', 'spring boot', 'spring',
-                    'laravel', 'rails', 'ruby on rails', 'next.js', 'nuxt.js', 'gatsby', 'svelte',
-                    'bootstrap', 'tailwind css', 'sass', 'scss', 'less', 'jquery', 'ajax', 'rest api',
-                    'graphql', 'webpack', 'vite', 'gulp', 'grunt'
-                ],
-                'databases': [
-                    'mysql', 'postgresql', 'postgres', 'mongodb', 'sqlite', 'redis', 'oracle',
-                    'sql server', 'microsoft sql server', 'elasticsearch', 'cassandra', 'dynamodb',
-                    'neo4j', 'couchdb', 'firebase', 'mariadb', 'influxdb', 'clickhouse'
-                ],
-                'cloud_devops': [
-                    'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp', 'google cloud',
-                    'docker', 'kubernetes', 'jenkins', 'git', 'gitlab', 'github', 'ci/cd', 'terraform',
-                    'ansible', 'puppet', 'chef', 'vagrant', 'helm', 'istio', 'nginx', 'apache',
-                    'linux', 'unix', 'ubuntu', 'centos', 'debian', 'redhat'
-                ],
-                'data_science': [
-                    'machine learning', 'deep learning', 'artificial intelligence', 'data science',
-                    'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'scikit-learn', 'sklearn',
-                    'matplotlib', 'seaborn', 'plotly', 'jupyter', 'anaconda', 'spark', 'hadoop',
-                    'tableau', 'power bi', 'excel', 'statistics', 'data analysis', 'data visualization'
-                ],
-                'mobile_development': [
-                    'android', 'ios', 'react native', 'flutter', 'xamarin', 'cordova', 'phonegap',
-                    'ionic', 'swift', 'objective-c', 'kotlin', 'java'
-                ],
-                'testing_tools': [
-                    'selenium', 'junit', 'testng', 'pytest', 'jest', 'mocha', 'cypress', 'cucumber',
-                    'postman', 'soap ui', 'jmeter', 'loadrunner'
-                ],
-                'other_tools': [
-                    'jira', 'confluence', 'slack', 'trello', 'asana', 'photoshop', 'illustrator',
-                    'figma', 'sketch', 'zeplin', 'invision', 'adobe xd', 'canva'
-                ]
-            }
-            
-            # Compile all skills into one list for matching
-            self.all_skills = []
-            for category in self.technical_skills.values():
-                self.all_skills.extend(category)
-            
-            # Convert to lowercase for matching
-            self.all_skills = list(set([skill.lower() for skill in self.all_skills]))
-        # Always initialize the fallback skills database
-        self.technical_skills = {
-            'programming_languages': [
-                'python', 'java', 'javascript', 'c++', 'c#', 'c', 'php', 'ruby', 'go', 'rust',
-                'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell',
-                'typescript', 'dart', 'objective-c', 'assembly', 'cobol', 'fortran', 'lua', 'groovy'
-            ],
-            'web_technologies': [
-                'html', 'css', 'javascript', 'typescript', 'react', 'angular', 'vue.js', 'vue',
-                'node.js', 'nodejs', 'express.js', 'express', 'django', 'flask', 'spring boot', 'spring',
-                'laravel', 'rails', 'ruby on rails', 'next.js', 'nuxt.js', 'gatsby', 'svelte',
-                'bootstrap', 'tailwind css', 'sass', 'scss', 'less', 'jquery', 'ajax', 'rest api',
-                'graphql', 'webpack', 'vite', 'gulp', 'grunt'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'postgres', 'mongodb', 'sqlite', 'redis', 'oracle',
-                'sql server', 'microsoft sql server', 'elasticsearch', 'cassandra', 'dynamodb',
-                'neo4j', 'couchdb', 'firebase', 'mariadb', 'influxdb', 'clickhouse'
-            ],
-            'cloud_devops': [
-                'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp', 'google cloud',
-                'docker', 'kubernetes', 'jenkins', 'git', 'gitlab', 'github', 'ci/cd', 'terraform',
-                'ansible', 'puppet', 'chef', 'vagrant', 'helm', 'istio', 'nginx', 'apache',
-                'linux', 'unix', 'ubuntu', 'centos', 'debian', 'redhat'
-            ],
-            'data_science': [
-                'machine learning', 'deep learning', 'artificial intelligence', 'data science',
-                'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'scikit-learn', 'sklearn',
-                'matplotlib', 'seaborn', 'plotly', 'jupyter', 'anaconda', 'spark', 'hadoop',
-                'tableau', 'power bi', 'excel', 'statistics', 'data analysis', 'data visualization'
-            ],
-            'mobile_development': [
-                'android', 'ios', 'react native', 'flutter', 'xamarin', 'cordova', 'phonegap',
-                'ionic', 'swift', 'objective-c', 'kotlin', 'java'
-            ],
-            'testing_tools': [
-                'selenium', 'junit', 'testng', 'pytest', 'jest', 'mocha', 'cypress', 'cucumber',
-                'postman', 'soap ui', 'jmeter', 'loadrunner'
-            ],
-            'other_tools': [
-                'jira', 'confluence', 'slack', 'trello', 'asana', 'photoshop', 'illustrator',
-                'figma', 'sketch', 'zeplin', 'invision', 'adobe xd', 'canva'
-            ]
+            log("📝 SkillNER not available, using manual skills extraction")
+        
+        STARTUP_TIMINGS['skillner_init'] = time.perf_counter() - started
+        self.memory['skillner_mb'] = round(rss_mb() - rss_before, 1)
+    
+    def _build_skill_extractor(self, SkillExtractor, SKILL_DB, PhraseMatcher):
+        """Build SkillNER with only the selected matcher groups."""
+        if set(self.matchers) == set(SKILLNER_MATCHERS):
+            return SkillExtractor(self.nlp, SKILL_DB, PhraseMatcher)
+        try:
+            from skillNer.matcher_class import Matchers, SkillsGetter
+            from skillNer.utils import Utils
+        except ImportError as e:
+            log(f"⚠️ Cannot load SkillNER matchers selectively ({e}), loading all of them")
+            return SkillExtractor(self.nlp, SKILL_DB, PhraseMatcher)
+        
+        include = [name for group in self.matchers for name in SKILLNER_MATCHERS[group]]
+        loaded = Matchers(self.nlp, SKILL_DB, PhraseMatcher).load_matchers(include=include)
+        # Same state SkillExtractor.__init__ sets up, minus the matchers we skip;
+        # annotate() still runs every stage, so those get an empty matcher
+        extractor = SkillExtractor.__new__(SkillExtractor)
+        extractor.tranlsator_func = False
+        extractor.nlp = self.nlp
+        extractor.skills_db = SKILL_DB
+        extractor.phraseMatcher = PhraseMatcher
+        extractor.matchers = {
+            name: loaded[name] if name in loaded else PhraseMatcher(self.nlp.vocab, attr="LOWER")
+            for names in SKILLNER_MATCHERS.values() for name in names
         }
+        extractor.skill_getters = SkillsGetter(self.nlp)
+        extractor.utils = Utils(self.nlp, SKILL_DB)
+        return extractor
+    
+    def memory_report(self):
+        """Resident memory now and what building this parser added, in MiB.
+        
+        Deltas are measured around this instance's setup, so models and tables
+        already loaded by an earlier parser in the process are not counted again.
+        """
+        report = dict(self.memory, rss_mb=rss_mb())
+        report['init_mb'] = round(report['rss_after_init_mb'] - report['rss_before_mb'], 1)
+        return report
+    
+    def fingerprint(self):
+        """Hash of everything that can change parse output for the same file.
+        
+        Covers the parser version, the spaCy model and pipeline, the extraction
+        backend order, the section options, the fallback ``technical_skills``
+        table and, when SkillNER is in use, SKILL_DB.
+        """
+        if self._fingerprint is None:
+            self.init_skillner()
+            digest = hashlib.sha256()
+            digest.update(PARSER_VERSION.encode('utf-8'))
+            digest.update(json.dumps({
+                'model': self.nlp.meta.get('name'),
+                'model_version': self.nlp.meta.get('version'),
+                'pipeline': self.nlp.pipe_names,
+                'technical_skills': dict(self.technical_skills),
+                'max_pages': self.max_pages,
+                'max_chars': self.max_chars,
+                'max_nlp_chars': self.max_nlp_chars,
+                'extractors': self.extractors.describe(),
+                # Per-section annotation can differ from one pass over the joined text
+                'section_workers': self.section_workers > 1,
+                'skill_sections': self.skill_sections,
+                'field_rules': self.field_rules_config,
+                'vocab': self.vocab.digest if self.vocab is not None else None,
+            }, sort_keys=True).encode('utf-8'))
+            if self.use_skillner:
+                SKILL_DB, _ = load_skillner(auto_install=False)
+                digest.update(json.dumps(SKILL_DB, sort_keys=True).encode('utf-8'))
+                if set(self.matchers) != set(SKILLNER_MATCHERS):
+                    digest.update(f"matchers:{','.join(self.matchers)}".encode('utf-8'))
+            if self.near_dup is not None:
+                # Reused skills depend on the similarity threshold
+                digest.update(f"near_dup:{self.near_dup.threshold}".encode('utf-8'))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+    
+    def iter_pdf_pages(self, pdf_path, max_pages=None, max_chars=None, stats=None, deadline=None):
+        """Yield page texts lazily, stopping at the page and character limits.
         
-        # Compile all skills into one list for matching
-        self.all_skills = []
-        for category in self.technical_skills.values():
-            self.all_skills.extend(category)
+        Despite the name any supported document (PDF, DOCX, plain text) is read,
+        with the backend ``self.extractors`` selects for its type. Limits default
+        to the parser's ``max_pages``/``max_chars``. If ``stats`` is a dict it is
+        filled with the backend used, pages read, characters yielded, whether the
+        document was truncated and the time spent. With a ``deadline`` whose
+        ``'pdf_extract'`` budget runs out, the remaining pages are skipped.
+        """
+        max_pages = self.max_pages if max_pages is None else max_pages
+        max_chars = self.max_chars if max_chars is None else max_chars
+        stats = {} if stats is None else stats
+        stats.update(backend=None, pages=0, total_pages=0, chars=0, truncated=False, seconds=0.0)
         
-        # Convert to lowercase for matching
-        self.all_skills = list(set([skill.lower() for skill in self.all_skills]))
+        started = time.perf_counter()
+        budget = deadline.budget('pdf_extract') if deadline is not None else None
+        backend = self.extractors.select(pdf_path)
+        stats['backend'] = backend.name
+        pages = backend.iter_pages(pdf_path, stats)
+        try:
+            for index, page_text in enumerate(pages):
+                if max_pages and index >= max_pages:
+                    stats['truncated'] = True
+                    break
+                if budget is not None and index and time.perf_counter() - started > budget:
+                    # Keep what was read so far rather than fail the parse
+                    stats['truncated'] = True
+                    deadline.degrade('pdf_extract')
+                    break
+                if max_chars and stats['chars'] + len(page_text) > max_chars:
+                    page_text = page_text[:max_chars - stats['chars']]
+                    stats['truncated'] = True
+                stats['pages'] += 1
+                stats['chars'] += len(page_text)
+                yield page_text
+                if stats['truncated']:
+                    break
+        finally:
+            # Release the backend's file handle now, not when the generator is collected
+            pages.close()
+            stats['seconds'] = time.perf_counter() - started
+    
+    def extract_text_from_pdf(self, pdf_path, max_pages=None, max_chars=None, stats=None, deadline=None):
+        """Extract a document's text, bounded by the page/character limits.
         
-        print(f"✅ Parser initialized successfully")
+        Time and characters are also recorded per backend (``extract_<backend>``
+        and ``extract_<backend>_chars``), so their throughput can be compared.
+        """
+        stats = {} if stats is None else stats
+        try:
+            with self.metrics.span('pdf_extract'):
+                pages = self.iter_pdf_pages(pdf_path, max_pages, max_chars, stats, deadline)
+                # Assemble once instead of growing a string page by page
+                text = "".join(page_text + "\n" for page_text in pages)
+        except Exception as e:
+            self.metrics.incr('pdf_extract_errors')
+            if stats.get('backend'):
+                self.metrics.incr(f"extract_{stats['backend']}_errors")
+            log(f"❌ Error extracting document text: {e}")
+            return None
+        self.metrics.record(f"extract_{stats['backend']}", stats['seconds'])
+        self.metrics.observe(f"extract_{stats['backend']}_chars", len(text))
+        self.metrics.observe('doc_pages', stats['pages'])
+        self.metrics.observe('doc_chars', len(text))
+        if stats['truncated']:
+            self.metrics.incr('docs_truncated')
+        return text
     
-    def extract_text_from_pdf(self, pdf_path):
-        """Extract text from PDF using PyPDF2."""
+    def extract_header_text(self, pdf_path, max_lines=5):
+        """Return only the first ``max_lines`` lines, reading as few pages as possible."""
+        lines = []
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+            for page_text in self.iter_pdf_pages(pdf_path):
+                lines.extend((page_text + "\n").split('\n')[:-1])
+                if len(lines) >= max_lines:
+                    break
         except Exception as e:
-            print(f"❌ Error extracting PDF text: {e}")
+            log(f"❌ Error extracting document text: {e}")
             return None
+        return '\n'.join(lines[:max_lines])
     
-    def extract_name(self, doc):
+    def extract_name(self, resume):
         """Extract first and last name more accurately."""
+        resume = self.as_resume_text(resume)
         # Get first few lines where names are typically located
-        lines = doc.text.split('\n')[:5]
-        header_text = ' '.join(lines)
+        lines = resume.lines
         
-        # Process header text with spacy
-        header_doc = self.nlp(header_text)
+        # spaCy runs over the header only, once per resume
+        with self.metrics.span('header_nlp'):
+            header_doc = resume.header_doc
         
         # Look for person entities in header
         potential_names = []
@@ -256,49 +717,51 @@ class ImprovedResumeParser:
         
         return "", ""
     
-    def extract_contact_info(self, doc):
+    def scan_fields(self, resume):
+        """Run the compiled field rules over the text once and keep the matches."""
+        if resume.field_matches is None:
+            resume.field_matches = self.field_rules.scan(resume.text)
+        return resume.field_matches
+    
+    def extract_contact_info(self, resume):
         """Extract email and phone number."""
-        text = doc.text
+        resume = self.as_resume_text(resume)
+        fields = self.scan_fields(resume)
         
-        # Extract emails
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = fields.get('email', [])
         email = emails[0] if emails else ""
         
-        # Extract phone numbers with better patterns
-        phone_patterns = [
-            r'(\+\d{1,3}[-.\s]?)?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})',
-            r'(\+\d{1,3}[-.\s]?)?(\d{10})',
-            r'(\+\d{1,3}[-.\s]?)?(\d{3})[-.\s]?(\d{3})[-.\s]?(\d{4})'
-        ]
-        
-        phones = []
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    phone = ''.join(match)
-                else:
-                    phone = match
-                # Clean phone number
-                digits_only = re.sub(r'\D', '', phone)
-                if 10 <= len(digits_only) <= 15:
-                    phones.append(phone)
-        
+        # Overlapping phone formats are already deduplicated by digits
+        phones = fields.get('phone', [])
         phone = phones[0] if phones else ""
         
         return email, phone
     
-    def extract_skills_accurately(self, doc):
+    def extract_skills_accurately(self, resume):
         """Extract technical skills using SkillNER and fallback methods."""
+        resume = self.as_resume_text(resume)
+        # Fast start defers building SkillNER until it is first needed
+        self.init_skillner()
         
         # Method 1: Try SkillNER first (most accurate)
         if self.use_skillner and self.skill_extractor:
             try:
-                print("🧠 Using SkillNER for skills extraction...")
+                log("🧠 Using SkillNER for skills extraction...")
                 # SkillNER expects text, not doc object
-                text = doc.text
-                annotations = self.skill_extractor.annotate(text)
+                text = resume.text
+                if self.max_nlp_chars and len(text) > self.max_nlp_chars:
+                    text = text[:self.max_nlp_chars]
+                    self.metrics.incr('nlp_truncated')
+                budget = resume.deadline.budget('skillner') if resume.deadline is not None else None
+                if budget is None and self.section_workers > 1 and resume.sections.has_headings:
+                    annotations = self._annotate_sections(resume)
+                elif budget is None:
+                    annotations = self._annotate(text)
+                else:
+                    annotations = self._annotate_within(text, budget)
+                    if annotations is None:
+                        resume.deadline.degrade('skillner')
+                        annotations = {}
                 
                 # Extract skills from SkillNER output
                 skillner_skills = []
@@ -312,50 +775,37 @@ class ImprovedResumeParser:
                     if 'ngram_scored' in annotations['results']:
                         for match in annotations['results']['ngram_scored']:
                             skill = match['doc_node_value'].strip() 
-                            if skill and len(skill) > 1 and match['score'] > 0.7:  # Only high confidence matches
+                            score = match['score']
+                            if self.vocab is not None:
+                                # Weight by how rare the matched tokens are
+                                score = self.vocab.ngram_confidence(skill, score)
+                            if skill and len(skill) > 1 and score > 0.7:  # Only high confidence matches
                                 skillner_skills.append(skill.title())
                 
                 # Remove duplicates while preserving order
                 skillner_skills = list(dict.fromkeys(skillner_skills))
                 
                 if skillner_skills:
-                    print(f"✅ SkillNER found {len(skillner_skills)} skills")
+                    log(f"✅ SkillNER found {len(skillner_skills)} skills")
+                    self.metrics.incr('skills_skillner_used')
+                    self.metrics.observe('skills_found', len(skillner_skills))
                     return skillner_skills
+                elif not annotations:
+                    log("⏱️ SkillNER would exceed its time budget, using fallback method")
                 else:
-                    print("⚠️ SkillNER found no skills, using fallback method")
+                    self.metrics.incr('skillner_empty')
+                    log("⚠️ SkillNER found no skills, using fallback method")
                     
             except Exception as e:
-                print(f"⚠️ SkillNER failed: {e}, using fallback method")
+                self.metrics.incr('skillner_errors')
+                log(f"⚠️ SkillNER failed: {e}, using fallback method")
         
         # Method 2: Fallback to manual extraction if SkillNER fails or finds nothing
-        print("🔍 Using manual skills extraction...")
-        text_lower = doc.text.lower()
-        found_skills = set()
-        
-        # Direct matching with word boundaries
-        for skill in self.all_skills:
-            # Use word boundaries for single words, phrase matching for multi-word skills
-            if ' ' in skill:
-                # Multi-word skill - look for exact phrase
-                if skill in text_lower:
-                    found_skills.add(skill)
-            else:
-                # Single word skill - use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.add(skill)
-        
-        # Look specifically in skills section
-        skills_section = self.extract_skills_section_text(text_lower)
-        if skills_section:
-            for skill in self.all_skills:
-                if ' ' in skill:
-                    if skill in skills_section:
-                        found_skills.add(skill)
-                else:
-                    pattern = r'\b' + re.escape(skill) + r'\b'
-                    if re.search(pattern, skills_section):
-                        found_skills.add(skill)
+        log("🔍 Using manual skills extraction...")
+        # Single pass of the compiled matcher; the skills section is a slice of
+        # the same text, so it needs no second scan
+        with self.metrics.span('skills_fallback'):
+            found_skills = set(self.skill_matcher.find_skills(resume.text))
         
         # Convert to proper case and sort
         skills_list = [skill.title() for skill in sorted(found_skills)]
@@ -367,83 +817,241 @@ class ImprovedResumeParser:
             if skill.lower() not in ['and', 'or', 'with', 'using', 'work', 'experience']:
                 cleaned_skills.append(skill)
         
-        print(f"✅ Manual extraction found {len(cleaned_skills)} skills")
+        log(f"✅ Manual extraction found {len(cleaned_skills)} skills")
+        self.metrics.incr('skills_fallback_used')
+        self.metrics.observe('skills_found', len(cleaned_skills))
         return cleaned_skills
     
-    def extract_skills_section_text(self, text_lower):
-        """Extract text from skills section."""
-        skills_patterns = [
-            r'(?:technical\s+)?skills?\s*:([^:]*?)(?=\n\s*[A-Za-z]+\s*:|$)',
-            r'core\s+competencies\s*:([^:]*?)(?=\n\s*[A-Za-z]+\s*:|$)',
-            r'technologies\s*:([^:]*?)(?=\n\s*[A-Za-z]+\s*:|$)',
-            r'programming\s+(?:languages?\s*)?:([^:]*?)(?=\n\s*[A-Za-z]+\s*:|$)',
-        ]
+    def _annotate(self, text):
+        """Run SkillNER and fold its speed into the per-character estimate."""
+        started = time.perf_counter()
+        with self.metrics.span('skillner'):
+            annotations = self.skill_extractor.annotate(text)
+        rate = (time.perf_counter() - started) / max(len(text), 1)
+        previous = self._skillner_rate
+        self._skillner_rate = rate if previous is None else 0.8 * previous + 0.2 * rate
+        return annotations
+    
+    def _annotate_sections(self, resume):
+        """Annotate each section on its own thread and merge the results.
         
-        for pattern in skills_patterns:
-            match = re.search(pattern, text_lower, re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        Sections are cut to the same ``max_nlp_chars`` total as the joined text.
+        """
+        parts = []
+        left = self.max_nlp_chars or None
+        for part in (resume.text[s.start:s.end] for s in resume.sections):
+            if left is not None:
+                if left <= 0:
+                    break
+                part = part[:left]
+                left -= len(part) + 1
+            if part.strip():
+                parts.append(part)
+        if len(parts) < 2:
+            return self._annotate("\n".join(parts))
         
-        return None
+        if self._section_pool is None:
+            with self._skillner_lock:
+                if self._section_pool is None:
+                    self._section_pool = ThreadPoolExecutor(max_workers=self.section_workers,
+                                                            thread_name_prefix="skillner-section")
+        merged = {'results': {'full_matches': [], 'ngram_scored': []}}
+        for annotations in self._section_pool.map(self._annotate, parts):
+            for key, matches in annotations.get('results', {}).items():
+                merged['results'].setdefault(key, []).extend(matches)
+        return merged
     
-    def extract_experience_years(self, doc):
+    def _annotate_within(self, text, budget):
+        """Run SkillNER if it can finish within ``budget`` seconds; None if not.
+        
+        Calls predicted to overrun are skipped outright. Otherwise SkillNER runs
+        on a daemon thread; Python cannot stop that thread, so on timeout it is
+        left to finish in the background and counted as a runaway.
+        """
+        rate = self._skillner_rate
+        if budget <= 0 or (rate is not None and rate * len(text) > budget):
+            self.metrics.incr('skillner_predicted_skips')
+            return None
+        with self._runaway_lock:
+            if self._skillner_runaway >= MAX_SKILLNER_RUNAWAY:
+                self.metrics.incr('skillner_busy_skips')
+                return None
+        
+        outcome = {}
+        done = threading.Event()
+        
+        def run():
+            try:
+                outcome['annotations'] = self._annotate(text)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                with self._runaway_lock:
+                    done.set()
+                    if outcome.get('abandoned'):
+                        self._skillner_runaway -= 1
+        
+        threading.Thread(target=run, name="skillner", daemon=True).start()
+        if not done.wait(budget):
+            with self._runaway_lock:
+                if not done.is_set():
+                    outcome['abandoned'] = True
+                    self._skillner_runaway += 1
+            if outcome.get('abandoned'):
+                self.metrics.incr('skillner_timeouts')
+                return None
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome['annotations']
+    
+    def section_skills(self, resume, skills):
+        """Group extracted ``skills`` by the section they appear in, as ``{section: [skills]}``.
+        
+        Each skill is placed at its first occurrence in the text, so the map
+        holds exactly the reported skills. Punctuation and spacing may differ from SkillNER's normalised
+        form; a skill that still cannot be located is listed under 'other'.
+        """
+        resume = self.as_resume_text(resume)
+        text = resume.text
+        found = {}
+        for skill in skills:
+            tokens = re.findall(r'\w+|[^\w\s]', skill.lower())
+            section = 'other'
+            if tokens:
+                pattern = r'\W*'.join(re.escape(token) for token in tokens)
+                if re.match(r'\w', tokens[0]):
+                    pattern = r'(?<!\w)' + pattern
+                if re.match(r'\w', tokens[-1]):
+                    pattern += r'(?!\w)'
+                match = re.search(pattern, text, re.IGNORECASE)
+                if match:
+                    section = resume.sections.section_at(match.start())
+            found.setdefault(section, []).append(skill)
+        return found
+    
+    def extract_experience_years(self, resume):
         """Extract years of experience more accurately."""
-        text_lower = doc.text.lower()
-        
-        # Patterns for experience
-        experience_patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:professional\s+)?(?:work\s+)?experience',
-            r'(?:over\s+|more than\s+)?(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            r'experience\s*:?\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:software\s+)?(?:development\s+)?(?:programming\s+)?experience',
-            r'(?:total\s+)?experience\s*:?\s*(\d+)\+?\s*years?'
-        ]
-        
-        years_found = []
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                try:
-                    years = int(match)
-                    if 0 <= years <= 50:  # Reasonable range
-                        years_found.append(years)
-                except ValueError:
-                    continue
+        resume = self.as_resume_text(resume)
+        years_found = self.scan_fields(resume).get('exp_years', [])
         
         # Return the maximum years found, or 0 if none
         return max(years_found) if years_found else 0
     
-    def parse_resume(self, file_path):
-        """Main method to parse a resume file."""
-        print(f"\n🎯 Analyzing resume: {os.path.basename(file_path)}")
-        print("-" * 50)
+    def cache_lookup(self, file_path):
+        """Return ``(cache_key, cached_results)``; both None when caching is off."""
+        if self.cache is None:
+            return None, None
+        from parse_cache import content_key
+        with open(file_path, 'rb') as file:
+            cache_key = content_key(file.read(), self.fingerprint())
+        return cache_key, self.cache.get(cache_key)
+    
+    def parse_resume(self, file_path, deadline=None, budgets=None):
+        """Main method to parse a resume file.
+        
+        ``deadline`` is an overall limit in seconds and ``budgets`` maps stages
+        (``'pdf_extract'``, ``'skillner'``) to their own limits. A stage that would
+        overrun degrades instead of failing: PDF extraction keeps the pages read
+        so far and skills fall back to the compiled matcher. Such results list
+        the stages under ``'degraded'`` and are not cached.
+        """
+        if deadline is not None or budgets:
+            deadline = Deadline(deadline, budgets)
+        with self.metrics.span('parse'):
+            results = self._parse_resume(file_path, deadline)
+        self.metrics.incr('resumes_parsed' if results else 'resumes_failed')
+        return results
+    
+    def _parse_resume(self, file_path, deadline=None):
+        log(f"\n🎯 Analyzing resume: {os.path.basename(file_path)}")
+        log("-" * 50)
         
         if not os.path.exists(file_path):
-            print(f"❌ File not found: {file_path}")
+            log(f"❌ File not found: {file_path}")
             return None
         
+        cache_key, cached = self.cache_lookup(file_path)
+        if cached is not None:
+            self.metrics.incr('cache_hits')
+            log("⚡ Returning cached results")
+            return ParseResult(**cached) if self.compact_results else cached
+        if cache_key is not None:
+            self.metrics.incr('cache_misses')
+        
         # Extract text
-        print("📄 Extracting text from PDF...")
-        text = self.extract_text_from_pdf(file_path)
+        log("📄 Extracting text from document...")
+        extract_stats = {}
+        text = self.extract_text_from_pdf(file_path, stats=extract_stats, deadline=deadline)
         
         if not text:
-            print("❌ Could not extract text from file")
+            log("❌ Could not extract text from file")
             return None
         
-        print(f"✅ Extracted {len(text)} characters")
+        log(f"✅ Extracted {len(text)} characters with {extract_stats['backend']}")
+        if extract_stats.get('truncated'):
+            log(f"⚠️ Truncated to {extract_stats['pages']} of {extract_stats['total_pages']} pages")
+        
+        results = self.extract_fields(ResumeText(text, self.nlp, deadline=deadline))
         
-        # Process with spaCy
-        print("🧠 Processing with spaCy NLP...")
-        doc = self.nlp(text)
-        print(f"✅ Processed {len(doc)} tokens")
+        # A degraded result depends on timing, so it must not stand in for a full parse
+        if cache_key is not None and not results.get('degraded'):
+            self.cache.put(cache_key, result_dict(results))
+        
+        log("✅ Analysis complete!")
+        return results
+    
+    def parse_texts(self, texts, batch_size=32, budgets=None):
+        """Parse already-extracted resume texts, running spaCy in batches via nlp.pipe.
+        
+        ``budgets`` applies per-stage time limits to each document, as in parse_resume.
+        """
+        resumes = [ResumeText(text, self.nlp, deadline=Deadline(budgets=budgets) if budgets else None)
+                   for text in texts]
+        needed = set(self.EXTRACTOR_INPUTS.values())
+        
+        # Batch only the spaCy inputs some extractor actually reads
+        if 'header' in needed:
+            with self.metrics.span('header_nlp_batch'):
+                header_docs = self.nlp.pipe((r.header_text for r in resumes), batch_size=batch_size)
+                for resume, header_doc in zip(resumes, header_docs):
+                    resume.header_doc = header_doc
+        if 'doc' in needed:
+            with self.metrics.span('doc_nlp_batch'):
+                docs = self.nlp.pipe((r.text for r in resumes), batch_size=batch_size)
+                for resume, doc in zip(resumes, docs):
+                    resume.doc = doc
+        
+        for resume in resumes:
+            yield self.extract_fields(resume)
+    
+    def as_resume_text(self, resume):
+        """Accept a ResumeText, a spaCy doc or a plain string."""
+        if isinstance(resume, ResumeText):
+            return resume
+        text = resume if isinstance(resume, str) else resume.text
+        return ResumeText(text, self.nlp)
+    
+    def extract_fields(self, resume):
+        """Extract the key fields from a resume's text."""
+        resume = self.as_resume_text(resume)
         
         # Extract the 6 key pieces of information
-        print("🔍 Extracting key information...")
+        log("🔍 Extracting key information...")
         
-        first_name, last_name = self.extract_name(doc)
-        email, phone = self.extract_contact_info(doc)
-        skills = self.extract_skills_accurately(doc)
-        exp_years = self.extract_experience_years(doc)
+        with self.metrics.span('name'):
+            first_name, last_name = self.extract_name(resume)
+        with self.metrics.span('contact'):
+            email, phone = self.extract_contact_info(resume)
+        signature, skills = None, None
+        if self.near_dup is not None:
+            with self.metrics.span('near_dup'):
+                signature, skills = self.near_dup_skills(resume)
+        reused = skills is not None
+        if skills is None:
+            with self.metrics.span('skills'):
+                skills = self.extract_skills_accurately(resume)
+        with self.metrics.span('experience'):
+            exp_years = self.extract_experience_years(resume)
         
         results = {
             'first_name': first_name,
@@ -453,10 +1061,39 @@ class ImprovedResumeParser:
             'skills': skills,
             'exp_years': exp_years
         }
+        if self.skill_sections:
+            with self.metrics.span('skill_sections'):
+                results['skill_sections'] = self.section_skills(resume, skills)
+        if resume.deadline is not None and resume.deadline.degraded:
+            results['degraded'] = list(resume.deadline.degraded)
+            for stage in resume.deadline.degraded:
+                self.metrics.incr(f'degraded_{stage}')
         
-        print("✅ Analysis complete!")
+        if signature is not None and not reused and 'degraded' not in results:
+            # Only index freshly extracted results so reuse never chains across variants
+            from near_dup import text_id
+            self.near_dup.insert(text_id(resume.text), signature=signature,
+                                 result=results, fingerprint=self.fingerprint())
+        
+        if self.compact_results:
+            return ParseResult(**results)
         return results
     
+    def near_dup_skills(self, resume):
+        """Look up skills from a near-duplicate parsed earlier.
+        
+        Returns ``(signature, skills)``; ``skills`` is None when there is no match.
+        """
+        signature = self.near_dup.hasher.signature(resume.text)
+        match = self.near_dup.best_result(signature=signature, fingerprint=self.fingerprint())
+        if match is None or match[2].get('skills') is None:
+            self.metrics.incr('near_dup_misses')
+            return signature, None
+        doc_id, score, stored = match
+        self.metrics.incr('near_dup_hits')
+        log(f"♻️ Reusing skills from a near-duplicate resume ({score:.0%} similar)")
+        return signature, list(stored['skills'])
+    
     def display_results(self, results):
         """Display parsing results in a clean format."""
         print("\n" + "="*60)
@@ -476,6 +1113,8 @@ class ImprovedResumeParser:
                 print(f"   {i:2d}. {skill}")
         else:
             print("\n🛠️ Skills: None detected")
+        if results.get('degraded'):
+            print(f"\n⏱️ Degraded to stay within the deadline: {', '.join(results['degraded'])}")
         
         print("="*60)
         
@@ -492,30 +1131,83 @@ class ImprovedResumeParser:
 
 def main():
     """Main execution function."""
-    print("🚀 IMPROVED RESUME PARSER")
-    print("=" * 50)
+    arg_parser = argparse.ArgumentParser(description="Improved resume parser")
+    # Your resume file - CHANGE THIS!
+    arg_parser.add_argument('resume_file', nargs='?', default="Shridhi_Gupta_Resume (1).pdf")
+    arg_parser.add_argument('--fast-start', action='store_true',
+                            help="Trimmed spaCy pipeline, lazy SkillNER, never pip install")
+    arg_parser.add_argument('--startup-time', action='store_true',
+                            help="Only build the parser and print startup timings as JSON")
+    arg_parser.add_argument('--quiet', action='store_true',
+                            help="No progress logs; print only the results as JSON")
+    arg_parser.add_argument('--metrics', choices=['json', 'prometheus'],
+                            help="Print per-stage timings and counters to stderr afterwards")
+    arg_parser.add_argument('--profile', action='store_true',
+                            help="Run the parse under cProfile and print the report to stderr")
+    arg_parser.add_argument('--low-memory', action='store_true',
+                            help="Trimmed spaCy pipeline, fewer SkillNER matchers, compact results")
+    arg_parser.add_argument('--matchers', help="Comma-separated SkillNER matchers to load: full,abbreviation,ngram")
+    arg_parser.add_argument('--skill-sections', action='store_true',
+                            help="Also report which resume section each skill appears in")
+    arg_parser.add_argument('--section-workers', type=int, default=1,
+                            help="Threads annotating resume sections with SkillNER in parallel")
+    arg_parser.add_argument('--deadline', type=float, help="Overall parse deadline in seconds")
+    arg_parser.add_argument('--skillner-budget', type=float, help="Most seconds SkillNER may take")
+    arg_parser.add_argument('--max-nlp-chars', type=int, default=MAX_NLP_CHARS,
+                            help="Characters of text SkillNER annotates (0 for no limit)")
+    arg_parser.add_argument('--extractor', choices=sorted(BACKENDS),
+                            help="Text extraction backend to prefer (default: best installed for the file type)")
+    args = arg_parser.parse_args()
+    
+    if args.quiet:
+        set_quiet(True)
+    
+    log("🚀 IMPROVED RESUME PARSER")
+    log("=" * 50)
     
     try:
         # Initialize parser
-        parser = ImprovedResumeParser()
+        matchers = args.matchers.split(',') if args.matchers else None
+        parser = ImprovedResumeParser(fast_start=args.fast_start, low_memory=args.low_memory, matchers=matchers,
+                                      max_nlp_chars=args.max_nlp_chars, section_workers=args.section_workers,
+                                      skill_sections=args.skill_sections, extractor=args.extractor)
         
-        # Your resume file - CHANGE THIS!
-        resume_file = "Shridhi_Gupta_Resume (1).pdf"
+        if args.startup_time:
+            STARTUP_TIMINGS['total'] = time.perf_counter() - _module_started
+            timings = {k: round(v, 4) for k, v in STARTUP_TIMINGS.items()}
+            print(json.dumps(dict(timings, memory=parser.memory_report())))
+            return
         
         # Parse the resume
-        results = parser.parse_resume(resume_file)
+        budgets = {'skillner': args.skillner_budget} if args.skillner_budget is not None else None
+        if args.profile:
+            results, report = profile_call(parser.parse_resume, args.resume_file,
+                                           deadline=args.deadline, budgets=budgets)
+            print(report, file=sys.stderr)
+        else:
+            results = parser.parse_resume(args.resume_file, deadline=args.deadline, budgets=budgets)
         
-        if results:
+        if results and args.quiet:
+            print(json.dumps(result_dict(results)))
+        elif results:
             # Display results
             parser.display_results(results)
             print(f"\nSuccess")
         else:
-            print("❌ Failed to parse resume")
+            log("❌ Failed to parse resume")
+        
+        if args.metrics == 'json':
+            print(parser.metrics.to_json(indent=2), file=sys.stderr)
+        elif args.metrics == 'prometheus':
+            print(parser.metrics.to_prometheus(), file=sys.stderr, end="")
+        
+        if not results:
+            sys.exit(1)
             
     except Exception as e:
-        print(f"❌ Error: {e}")
-        print("🔧 Make sure all dependencies are installed")
+        print(f"❌ Error: {e}", file=sys.stderr)
+        print("🔧 Make sure all dependencies are installed", file=sys.stderr)
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
-   
\ No newline at end of file
@@ -0,0 +1,133 @@
+import re
+from bisect import bisect_right
+
+# Heading wording per section; anything not listed here is found as 'other'
+SECTION_HEADINGS = {
+    'skills': [
+        'skills', 'technical skills', 'key skills', 'core skills', 'skill set', 'skillset',
+        'core competencies', 'competencies', 'technologies', 'tech stack', 'tools and technologies',
+        'technical proficiency', 'areas of expertise',
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'employment', 'employment history', 'work history', 'career history',
+        'internship', 'internships', 'internship experience',
+    ],
+    'education': [
+        'education', 'educational qualifications', 'academic qualifications', 'qualifications',
+        'academic background', 'academics', 'academic details', 'education and training',
+    ],
+    'projects': [
+        'projects', 'personal projects', 'academic projects', 'key projects', 'major projects',
+        'project experience', 'project work',
+    ],
+    'other': [
+        'summary', 'professional summary', 'profile', 'profile summary', 'about me', 'objective',
+        'career objective', 'certifications', 'certificates', 'achievements', 'awards',
+        'honors and awards', 'publications', 'languages', 'interests', 'hobbies',
+        'extracurricular activities', 'positions of responsibility', 'volunteering',
+        'references', 'declaration', 'personal details',
+    ],
+}
+
+# Header lines (name, title, contact details) are short; a longer line or a full sentence is prose
+HEADER_MAX_WORDS = 8
+
+_TITLE_TO_SECTION = {title: name for name, titles in SECTION_HEADINGS.items() for title in titles}
+# A heading is a line holding only a known title (bullets, numbering and a trailing
+# colon allowed), or a known title followed by a colon and inline content
+HEADING = re.compile(
+    r'^[ \t]*[^\w\n]{0,3}[ \t]*(?P<title>'
+    + '|'.join(sorted((re.escape(t).replace(r'\ ', r'\s+') for t in _TITLE_TO_SECTION),
+                      key=len, reverse=True))
+    + r')[ \t]*(?::[^\n]*|[ \t]*)$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+class Section:
+    """One span of the resume text: ``text[start:end]`` under heading ``title``."""
+
+    __slots__ = ('name', 'title', 'start', 'end')
+
+    def __init__(self, name, title, start, end):
+        self.name = name
+        self.title = title
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"Section({self.name!r}, {self.title!r}, {self.start}, {self.end})"
+
+
+class SectionIndex:
+    """Splits a resume once into header, skills, experience, education, projects and other spans.
+
+    The header is at most the first ``header_lines`` lines, ending early at
+    the first recognised heading, blank line or line of prose; anything
+    between it and the first heading (an untitled summary, say) is 'other'. Spans are character offsets into the
+    original text, so matches found in a slice map back to the whole document.
+    """
+
+    def __init__(self, text, header_lines=5):
+        self.text = text
+        self.sections = []
+
+        headings = [(m.start(), _TITLE_TO_SECTION[' '.join(m.group('title').lower().split())],
+                     m.group('title')) for m in HEADING.finditer(text)]
+        self.has_headings = bool(headings)
+
+        body_end = headings[0][0] if headings else len(text)
+        header_end = 0
+        for _ in range(header_lines):
+            newline = text.find('\n', header_end, body_end)
+            line_end = body_end if newline < 0 else newline
+            line = text[header_end:line_end].strip()
+            if header_end and (not line or len(line.split()) > HEADER_MAX_WORDS or line.endswith('.')):
+                # A blank line or a sentence after the name ends the contact block
+                break
+            if newline < 0:
+                header_end = body_end
+                break
+            header_end = newline + 1
+        self._add('header', None, 0, header_end)
+        self._add('other', None, header_end, body_end)
+
+        for index, (start, name, title) in enumerate(headings):
+            end = headings[index + 1][0] if index + 1 < len(headings) else len(text)
+            self._add(name, title, start, end)
+
+        self._starts = [section.start for section in self.sections]
+
+    def _add(self, name, title, start, end):
+        if end > start or name == 'header':
+            self.sections.append(Section(name, title, start, end))
+
+    def __iter__(self):
+        return iter(self.sections)
+
+    def spans(self, *names):
+        """Sections with one of ``names``, in document order."""
+        return [section for section in self.sections if section.name in names]
+
+    def slices(self, *names):
+        return [self.text[s.start:s.end] for s in self.spans(*names)]
+
+    def text_for(self, *names):
+        """The text of all ``names`` sections joined in document order."""
+        return "\n".join(self.slices(*names))
+
+    def section_at(self, offset):
+        """Name of the section containing character ``offset``."""
+        index = bisect_right(self._starts, offset) - 1
+        return self.sections[max(index, 0)].name
+
+    def header_lines(self, limit=5):
+        """The header's first ``limit`` lines (the text's, if a heading comes first)."""
+        header = self.sections[0]
+        text = self.text[header.start:header.end] if self.text[header.start:header.end].strip() else self.text
+        return text.rstrip('\n').split('\n')[:limit]
+
+    def summary(self):
+        """``[{name, title, start, end}]`` for debugging and reports."""
+        return [{'name': s.name, 'title': s.title, 'start': s.start, 'end': s.end} for s in self.sections]
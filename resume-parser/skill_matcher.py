@@ -0,0 +1,118 @@
+from collections import deque
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == '_'
+
+
+def skill_db_categories(skill_db, skills_by_category=None):
+    """Group SkillNER's SKILL_DB names and full forms by skill type.
+
+    Adds to ``skills_by_category`` when given, so SKILL_DB can be merged
+    into another ``{category: [skill, ...]}`` table.
+    """
+    skills_by_category = {} if skills_by_category is None else skills_by_category
+    for entry in skill_db.values():
+        category = entry.get('skill_type') or 'other'
+        forms = skills_by_category.setdefault(category, [])
+        forms.append(entry['skill_name'])
+        full_form = entry.get('high_surfce_forms', {}).get('full')
+        if full_form:
+            forms.append(full_form)
+    return skills_by_category
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds every known skill in a single scan.
+
+    Built once from ``{category: [skill, ...]}``; matching is case-insensitive
+    and only reports hits that are not embedded in a longer word, so ``'go'``
+    does not fire inside ``'google'`` while ``'c++'`` and ``'node.js'`` still work.
+    Scan time depends on the text length, not on the size of the dictionary.
+    """
+
+    def __init__(self, skills_by_category):
+        """Compile the automaton from a mapping of category -> skills."""
+        # Trie stored as parallel lists indexed by state id
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self.categories = {}
+
+        for category, skills in skills_by_category.items():
+            for skill in skills:
+                skill = skill.strip().lower()
+                if not skill:
+                    continue
+                if skill not in self.categories:
+                    self.categories[skill] = []
+                    self._add(skill)
+                if category not in self.categories[skill]:
+                    self.categories[skill].append(category)
+
+        self._build_failure_links()
+
+    @classmethod
+    def from_skill_db(cls, skill_db):
+        """Build a matcher from SkillNER's SKILL_DB, keyed by skill type."""
+        return cls(skill_db_categories(skill_db))
+
+    def __len__(self):
+        return len(self.categories)
+
+    def _add(self, skill):
+        state = 0
+        for ch in skill:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append(skill)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def finditer(self, text):
+        """Yield ``(skill, start, end, categories)`` for every whole-word hit."""
+        goto, fail, output = self._goto, self._fail, self._output
+        length = len(text)
+        state = 0
+
+        # Lowercase per character so offsets always index into the original text
+        for i, ch in enumerate(text):
+            ch = ch.lower()
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+
+            end = i + 1
+            if end < length and _is_word_char(text[end]):
+                # Only skills that themselves end in punctuation may abut a word char
+                candidates = [s for s in output[state] if not _is_word_char(s[-1])]
+            else:
+                candidates = output[state]
+
+            for skill in candidates:
+                start = end - len(skill)
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(skill[0]):
+                    continue
+                yield skill, start, end, self.categories[skill]
+
+    def find_skills(self, text):
+        """Return the distinct skills in ``text`` in order of first appearance."""
+        return list(dict.fromkeys(skill for skill, _, _, _ in self.finditer(text)))
@@ -0,0 +1,217 @@
+import os
+import sys
+import json
+import mmap
+import math
+import struct
+import hashlib
+import argparse
+from array import array
+
+from skill_matcher import skill_db_categories
+
+MAGIC = b"SKVOCAB1"
+# magic, n_skills, n_tokens, max_idf, then (offset, length) of each section
+SECTIONS = ('categories', 'skill_offsets', 'skill_blob', 'skill_masks',
+            'token_offsets', 'token_blob', 'token_weights')
+HEADER = struct.Struct("<8sIIf" + "QQ" * len(SECTIONS))
+
+DEFAULT_VOCAB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill_vocab.bin")
+DEFAULT_TOKEN_DIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "token_dist.json")
+
+
+def _strings_section(strings):
+    """Pack sorted strings as a uint32 offsets array plus one UTF-8 blob."""
+    offsets = array('I', [0])
+    blob = bytearray()
+    for value in strings:
+        blob += value
+        offsets.append(len(blob))
+    return offsets.tobytes(), bytes(blob)
+
+
+def build_vocab(path, skills_by_category, token_counts=None):
+    """Compile skills, their categories and token IDF weights into one binary file.
+
+    Skills and tokens are stored sorted so lookups are a binary search over
+    the memory-mapped file; nothing is unpacked into Python objects at load.
+    """
+    categories = sorted(skills_by_category)
+    if len(categories) > 32:
+        raise ValueError("At most 32 skill categories fit in the category bitmask")
+
+    masks = {}
+    for bit, category in enumerate(categories):
+        for skill in skills_by_category[category]:
+            key = ' '.join(skill.lower().split()).encode('utf-8')
+            if key:
+                masks[key] = masks.get(key, 0) | (1 << bit)
+    skills = sorted(masks)
+
+    token_counts = token_counts or {}
+    tokens = sorted(token.lower().encode('utf-8') for token in token_counts)
+    counts = {token.lower(): count for token, count in token_counts.items()}
+    total = sum(counts.values()) or 1
+    # Normalised IDF in [0, 1]: 0 for the most common token, 1 for a token seen once
+    max_idf = math.log(total) or 1.0
+    weights = array('f', (math.log(total / max(counts[t.decode('utf-8')], 1)) / max_idf for t in tokens))
+
+    skill_offsets, skill_blob = _strings_section(skills)
+    token_offsets, token_blob = _strings_section(tokens)
+    sections = [
+        json.dumps(categories).encode('utf-8'),
+        skill_offsets,
+        skill_blob,
+        array('I', (masks[s] for s in skills)).tobytes(),
+        token_offsets,
+        token_blob,
+        weights.tobytes(),
+    ]
+
+    body = bytearray()
+    spans = []
+    for data in sections:
+        # Keep every section 8-byte aligned so it can be cast in place
+        body += b"\0" * (-(HEADER.size + len(body)) % 8)
+        spans.append((HEADER.size + len(body), len(data)))
+        body += data
+    header = HEADER.pack(MAGIC, len(skills), len(tokens), max_idf,
+                         *[value for span in spans for value in span])
+
+    with open(path, 'wb') as file:
+        file.write(header)
+        file.write(body)
+
+
+class SkillVocab:
+    """Read-only, memory-mapped view of a file written by ``build_vocab``.
+
+    Every worker that opens the same file shares its pages through the OS
+    page cache instead of holding its own dicts of skills and weights.
+    """
+
+    def __init__(self, path=DEFAULT_VOCAB_PATH):
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+
+        magic, self.n_skills, self.n_tokens, self.max_idf, *spans = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a skill vocabulary file")
+        sections = {name: view[offset:offset + length]
+                    for name, (offset, length) in zip(SECTIONS, zip(spans[::2], spans[1::2]))}
+
+        self.categories = json.loads(bytes(sections['categories']))
+        self._skill_offsets = sections['skill_offsets'].cast('I')
+        self._skill_blob = sections['skill_blob']
+        self._skill_masks = sections['skill_masks'].cast('I')
+        self._token_offsets = sections['token_offsets'].cast('I')
+        self._token_blob = sections['token_blob']
+        self._token_weights = sections['token_weights'].cast('f')
+
+        self.digest = hashlib.sha256(self._mmap).hexdigest()
+
+    def __len__(self):
+        return self.n_skills
+
+    @staticmethod
+    def _find(offsets, blob, count, key):
+        """Binary search a packed sorted string table; returns the index or -1."""
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = blob[offsets[mid]:offsets[mid + 1]].tobytes()
+            if value < key:
+                lo = mid + 1
+            elif value > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def _skill_index(self, skill):
+        key = ' '.join(skill.lower().split()).encode('utf-8')
+        return self._find(self._skill_offsets, self._skill_blob, self.n_skills, key)
+
+    def __contains__(self, skill):
+        return self._skill_index(skill) >= 0
+
+    def skill_categories(self, skill):
+        """Categories a skill belongs to, or an empty list if unknown."""
+        index = self._skill_index(skill)
+        if index < 0:
+            return []
+        mask = self._skill_masks[index]
+        return [name for bit, name in enumerate(self.categories) if mask & (1 << bit)]
+
+    def token_weight(self, token, default=1.0):
+        """Normalised IDF of a token in [0, 1]; unseen tokens count as rare."""
+        key = token.lower().encode('utf-8')
+        index = self._find(self._token_offsets, self._token_blob, self.n_tokens, key)
+        return self._token_weights[index] if index >= 0 else default
+
+    def ngram_confidence(self, text, score):
+        """Rescale a SkillNER ``ngram_scored`` score by how informative its tokens are.
+
+        Matches made of common tokens ("management", "system") are damped to
+        half their score; matches on rare tokens keep up to 1.5x, capped at 1.
+        """
+        tokens = text.split()
+        if not tokens:
+            return score
+        mean_weight = sum(self.token_weight(t) for t in tokens) / len(tokens)
+        return min(1.0, score * (0.5 + mean_weight))
+
+    def iter_skills(self):
+        """Yield ``(skill, categories)`` for every skill in sorted order."""
+        for index in range(self.n_skills):
+            skill = self._skill_blob[self._skill_offsets[index]:self._skill_offsets[index + 1]]
+            mask = self._skill_masks[index]
+            yield (skill.tobytes().decode('utf-8'),
+                   [name for bit, name in enumerate(self.categories) if mask & (1 << bit)])
+
+    def skills_by_category(self):
+        """Rebuild ``{category: [skills]}``, e.g. to compile a SkillMatcher."""
+        grouped = {name: [] for name in self.categories}
+        for skill, categories in self.iter_skills():
+            for category in categories:
+                grouped[category].append(skill)
+        return grouped
+
+    def close(self):
+        # Release the casts before the mmap they point into
+        for name in ('_skill_offsets', '_skill_blob', '_skill_masks',
+                     '_token_offsets', '_token_blob', '_token_weights'):
+            getattr(self, name).release()
+        self._mmap.close()
+
+
+def main():
+    """Build the vocabulary artifact from technical_skills, SKILL_DB and token_dist.json."""
+    arg_parser = argparse.ArgumentParser(description="Build the memory-mappable skill vocabulary")
+    arg_parser.add_argument('--output', default=DEFAULT_VOCAB_PATH)
+    arg_parser.add_argument('--token-dist', default=DEFAULT_TOKEN_DIST_PATH)
+    arg_parser.add_argument('--no-skill-db', action='store_true', help="Only include technical_skills")
+    args = arg_parser.parse_args()
+
+    from resume import TECHNICAL_SKILLS, load_skillner
+
+    skills_by_category = {name: list(skills) for name, skills in TECHNICAL_SKILLS.items()}
+    if not args.no_skill_db:
+        SKILL_DB, _ = load_skillner(auto_install=False)
+        if SKILL_DB:
+            skill_db_categories(SKILL_DB, skills_by_category)
+
+    with open(args.token_dist, 'r', encoding='utf-8') as file:
+        token_counts = json.load(file)
+
+    build_vocab(args.output, skills_by_category, token_counts)
+    vocab = SkillVocab(args.output)
+    print(f"✅ Wrote {args.output}: {len(vocab)} skills, {vocab.n_tokens} tokens, "
+          f"{len(vocab.categories)} categories, {os.path.getsize(args.output) / 1024:.0f} KB", file=sys.stderr)
+    vocab.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+import os
+import sys
+import csv
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+import multiprocessing
+from collections import deque
+
+from resume import ImprovedResumeParser, ResumeText
+from exporters import pg_array
+
+# Tagging parser owned by each pool worker, built once by _init_worker
+_worker_parser = None
+
+
+def iter_jobs(stream):
+    """Yield job rows from a JSON lines stream, one at a time."""
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            print(f"⚠️ Skipping line {number}: {e}", file=sys.stderr)
+
+
+def _batches(rows, size):
+    """Group an iterable into lists of at most ``size`` items without reading ahead."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _tag_key(tag):
+    return ' '.join(str(tag).lower().split())
+
+
+def description_digest(description):
+    return hashlib.sha256(description.encode('utf-8')).hexdigest()
+
+
+def merge_tags(existing, found, replace=False):
+    """Add extracted skills to a job's tags, skipping ones already present in any case."""
+    tags = [] if replace else [tag for tag in existing or [] if str(tag).strip()]
+    seen = {_tag_key(tag) for tag in tags}
+    for skill in found:
+        key = _tag_key(skill)
+        if key and key not in seen:
+            seen.add(key)
+            tags.append(skill)
+    return tags
+
+
+class TagState:
+    """SQLite record of which description each job was last tagged from.
+
+    A row is skipped when its description hash and the tagger fingerprint
+    (parser version and skill tables) both match what was stored, so a
+    nightly run only pays for new and edited jobs, and changing the skill
+    tables retags everything once.
+    """
+
+    def __init__(self, path="tag_state.sqlite"):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS job_tags ("
+            " job_id TEXT PRIMARY KEY,"
+            " digest TEXT NOT NULL,"
+            " fingerprint TEXT NOT NULL,"
+            " tagged_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def unchanged(self, digests, fingerprint):
+        """Return the job ids in ``{job_id: digest}`` whose stored state matches."""
+        ids = list(digests)
+        same = set()
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self._db.execute(
+                f"SELECT job_id, digest FROM job_tags WHERE fingerprint = ? "
+                f"AND job_id IN ({','.join('?' * len(chunk))})",
+                [fingerprint] + chunk
+            )
+            same.update(job_id for job_id, digest in rows if digests[job_id] == digest)
+        return same
+
+    def record(self, digests, fingerprint):
+        """Store the digests of a tagged batch in one transaction."""
+        now = time.time()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO job_tags (job_id, digest, fingerprint, tagged_at) VALUES (?, ?, ?, ?)",
+            [(job_id, digest, fingerprint, now) for job_id, digest in digests.items()]
+        )
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+def tag_descriptions(parser, descriptions):
+    """Run the parser's skill extraction over each description.
+
+    Without SkillNER the compiled matcher's canonical names (``aws``,
+    ``node.js``) are used as they are rather than title-cased.
+    """
+    parser.init_skillner()
+    if not parser.use_skillner:
+        return [parser.skill_matcher.find_skills(text) for text in descriptions]
+    # ResumeText builds spaCy docs lazily and skill extraction never asks for one
+    return [parser.extract_skills_accurately(ResumeText(text, parser.nlp)) for text in descriptions]
+
+
+def _build_tagger(fast_start, skillner):
+    nlp = None
+    if not skillner:
+        # The compiled matcher needs no model; a blank pipeline skips loading en_core_web_sm
+        import spacy
+        nlp = spacy.blank('en')
+    return ImprovedResumeParser(fast_start=fast_start, quiet=True, skillner=skillner, nlp=nlp)
+
+
+def _init_worker(fast_start, skillner):
+    """Build the per-process tagger; progress logs go to stderr."""
+    global _worker_parser
+    sys.stdout = sys.stderr
+    _worker_parser = _build_tagger(fast_start, skillner)
+
+
+def _worker_fingerprint():
+    return _worker_parser.fingerprint()
+
+
+def _worker_tag(descriptions):
+    return tag_descriptions(_worker_parser, descriptions)
+
+
+def tag_jobs(rows, state=None, batch_size=500, n_process=1, fast_start=True, skillner=False,
+             replace=False, stats=None):
+    """Tag job rows in batches, yielding ``{'id', 'tags'}`` for jobs whose tags change.
+
+    Rows are read lazily and at most a few batches are held at once, so memory
+    stays flat however long the export is. Rows whose description is
+    unchanged since the last run (per ``state``, a TagState) are skipped.
+    With ``n_process > 1`` batches are tagged by a process pool, in order.
+    ``stats`` is an optional dict that receives running counts.
+    """
+    stats = stats if stats is not None else {}
+    for name in ('seen', 'skipped', 'unchanged', 'tagged', 'updated'):
+        stats.setdefault(name, 0)
+
+    pool = None
+    if n_process > 1:
+        pool = multiprocessing.Pool(processes=n_process, initializer=_init_worker,
+                                    initargs=(fast_start, skillner))
+        fingerprint = pool.apply(_worker_fingerprint)
+        parser = None
+    else:
+        parser = _build_tagger(fast_start, skillner)
+        fingerprint = parser.fingerprint()
+
+    def prepare(batch):
+        jobs = {}
+        for job in batch:
+            stats['seen'] += 1
+            description = job.get('description')
+            if job.get('id') is None or not isinstance(description, str) or not description.strip():
+                stats['skipped'] += 1
+                continue
+            jobs[str(job['id'])] = job
+        digests = {job_id: description_digest(job['description']) for job_id, job in jobs.items()}
+        if state is not None:
+            for job_id in state.unchanged(digests, fingerprint):
+                stats['unchanged'] += 1
+                del jobs[job_id]
+                del digests[job_id]
+        return list(jobs.values()), digests
+
+    def finish(jobs, found):
+        updates = []
+        for job, skills in zip(jobs, found):
+            stats['tagged'] += 1
+            tags = merge_tags(job.get('tags'), skills, replace=replace)
+            if tags != (job.get('tags') or []):
+                stats['updated'] += 1
+                updates.append({'id': job['id'], 'tags': tags})
+        return updates
+
+    try:
+        if pool is None:
+            for batch in _batches(rows, batch_size):
+                jobs, digests = prepare(batch)
+                found = tag_descriptions(parser, [job['description'] for job in jobs])
+                yield from finish(jobs, found)
+                # Record only once the batch's updates have been handed to the caller
+                if state is not None:
+                    state.record(digests, fingerprint)
+            return
+
+        # Keep a bounded window of batches in flight; Pool.imap would read the whole input
+        in_flight = deque()
+        batches = _batches(rows, batch_size)
+        while True:
+            while len(in_flight) < 2 * n_process:
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                jobs, digests = prepare(batch)
+                in_flight.append((jobs, digests, pool.apply_async(
+                    _worker_tag, ([job['description'] for job in jobs],))))
+            if not in_flight:
+                break
+            jobs, digests, result = in_flight.popleft()
+            yield from finish(jobs, result.get())
+            if state is not None:
+                state.record(digests, fingerprint)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+def main():
+    """Tag job descriptions from a JSON lines export and emit tag updates."""
+    arg_parser = argparse.ArgumentParser(
+        description="Fill in Job.tags from job descriptions",
+        epilog="csv output loads with: COPY job_tag_updates (id, tags) FROM STDIN WITH (FORMAT csv, HEADER true)"
+    )
+    arg_parser.add_argument('input', nargs='?', default='-',
+                            help="JSON lines of Job rows with id, description and tags (default: stdin)")
+    arg_parser.add_argument('--state', default="tag_state.sqlite",
+                            help="SQLite file remembering which descriptions were already tagged")
+    arg_parser.add_argument('--no-state', action='store_true', help="Retag every row")
+    arg_parser.add_argument('--output', help="Write updates here instead of stdout")
+    arg_parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl')
+    arg_parser.add_argument('--batch-size', type=int, default=500)
+    arg_parser.add_argument('--processes', type=int, default=1)
+    arg_parser.add_argument('--skillner', action='store_true',
+                            help="Use SkillNER as well as the compiled matcher (much slower)")
+    arg_parser.add_argument('--replace', action='store_true',
+                            help="Replace existing tags instead of adding to them")
+    args = arg_parser.parse_args()
+
+    source = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    # Keep stdout clean for updates; parser progress goes to stderr
+    sys.stdout = sys.stderr
+
+    state = None if args.no_state else TagState(args.state)
+    writer = None
+    if args.format == 'csv':
+        writer = csv.writer(out)
+        writer.writerow(['id', 'tags'])
+
+    stats = {}
+    started = time.perf_counter()
+    try:
+        for update in tag_jobs(iter_jobs(source), state=state, batch_size=args.batch_size,
+                               n_process=args.processes, skillner=args.skillner,
+                               replace=args.replace, stats=stats):
+            if writer is not None:
+                writer.writerow([update['id'], pg_array(update['tags'])])
+            else:
+                out.write(json.dumps(update) + "\n")
+    finally:
+        out.flush()
+        if args.output:
+            out.close()
+        if args.input != '-':
+            source.close()
+        if state is not None:
+            state.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ Read {stats.get('seen', 0)} jobs: {stats.get('tagged', 0)} tagged, "
+          f"{stats.get('unchanged', 0)} unchanged, {stats.get('skipped', 0)} without id or description; "
+          f"{stats.get('updated', 0)} updates in {elapsed:.1f}s "
+          f"({stats.get('seen', 0) / max(elapsed, 1e-9):.0f} jobs/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import os
+import json
+import time
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from queue_worker import QueueWorker
+
+
+class StubParser:
+    """Stands in for ImprovedResumeParser: parses any path that exists."""
+
+    def __init__(self):
+        self.calls = []
+
+    def parse_resume(self, path):
+        self.calls.append(path)
+        if not os.path.exists(path):
+            return None
+        return {'first_name': "Test", 'skills': ['python'], 'path': path}
+
+
+def make_worker(redis, parser, **options):
+    options = dict(dict(concurrency=2, max_attempts=3, retry_delay=0.01, poll_timeout=0.1,
+                        worker_id="test-worker"), **options)
+    return QueueWorker(redis, parser, **options)
+
+
+def test_successful_job_writes_result(tmp_path):
+    resume_path = tmp_path / "cv.txt"
+    resume_path.write_text("Test Person\npython\n")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    worker = make_worker(redis, StubParser())
+
+    async def scenario():
+        job_id = await worker.enqueue(str(resume_path), job_id="job-1")
+        await worker.run(idle_exit=True)
+        record = json.loads(await redis.get(worker.keys.result(job_id)))
+        return record, await redis.lrange(worker.keys.done, 0, -1), await redis.llen(worker.processing)
+
+    record, done, in_flight = asyncio.run(scenario())
+    assert record['ok'] is True
+    assert record['result']['skills'] == ['python']
+    assert record['attempts'] == 1
+    assert done == ["job-1"]
+    assert in_flight == 0
+    assert worker.stats['processed'] == 1
+
+
+def test_bad_payload_is_failed():
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    parser = StubParser()
+    worker = make_worker(redis, parser)
+
+    async def scenario():
+        await redis.lpush(worker.keys.jobs, "not json")
+        await worker.run(idle_exit=True)
+        return await redis.lrange(worker.keys.failed, 0, -1), await redis.llen(worker.processing)
+
+    failed, in_flight = asyncio.run(scenario())
+    assert len(failed) == 1
+    assert json.loads(failed[0])['error'].startswith("Bad job payload")
+    assert in_flight == 0
+    assert parser.calls == []
+    assert worker.stats['failed'] == 1
+
+
+def test_missing_file_is_retried_then_failed(tmp_path):
+    missing = str(tmp_path / "missing.pdf")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    parser = StubParser()
+    worker = make_worker(redis, parser, max_attempts=3)
+
+    async def scenario():
+        job_id = await worker.enqueue(missing, job_id="job-2")
+        await worker.run(idle_exit=True)
+        record = json.loads(await redis.get(worker.keys.result(job_id)))
+        return record, await redis.lrange(worker.keys.failed, 0, -1), await redis.zcard(worker.keys.delayed)
+
+    record, failed, delayed = asyncio.run(scenario())
+    assert parser.calls == [missing] * 3
+    assert record['ok'] is False
+    assert record['attempts'] == 3
+    assert record['error'] == "Could not parse resume"
+    assert [json.loads(payload)['id'] for payload in failed] == ["job-2"]
+    assert delayed == 0
+    assert worker.stats['retried'] == 2
+    assert worker.stats['failed'] == 1
+
+
+def test_reclaim_stale_requeues_dead_workers_jobs(tmp_path):
+    resume_path = tmp_path / "cv.txt"
+    resume_path.write_text("Test Person\n")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    worker = make_worker(redis, StubParser())
+    dead = worker.keys.processing("dead-worker")
+    alive = worker.keys.processing("live-worker")
+
+    async def scenario():
+        # A crashed worker's list has no heartbeat; a running one's has
+        await redis.lpush(dead, QueueWorker.encode_job(str(resume_path), job_id="job-3"))
+        await redis.lpush(alive, QueueWorker.encode_job(str(resume_path), job_id="job-4"))
+        await redis.set(worker.keys.heartbeat("live-worker"), time.time(), ex=60)
+
+        reclaimed = await worker.reclaim_stale()
+        requeued = await redis.llen(worker.keys.jobs)
+        await worker.run(idle_exit=True)
+        return (reclaimed, requeued, await redis.llen(dead), await redis.llen(alive),
+                await redis.exists(worker.keys.result("job-3")))
+
+    reclaimed, requeued, dead_left, alive_left, has_result = asyncio.run(scenario())
+    assert reclaimed == 1
+    assert requeued == 1
+    assert dead_left == 0
+    assert alive_left == 1
+    assert has_result
@@ -0,0 +1,20 @@
+import IORedis from 'ioredis';
+import { randomUUID } from 'crypto';
+
+// Consumed by resume-parser/queue_worker.py; keep the key layout in sync with QueueKeys there
+const PREFIX = process.env.RESUME_QUEUE_PREFIX || 'resume-parse';
+const connection = new IORedis(process.env.REDIS_URL || 'redis://localhost:6379');
+
+export async function enqueueResumeParse(filePath, meta = {}) {
+  const id = meta.id || randomUUID();
+  await connection.lpush(
+    `${PREFIX}:jobs`,
+    JSON.stringify({ ...meta, id, path: filePath, attempts: 0 })
+  );
+  return id;
+}
+
+export async function getResumeParseResult(id) {
+  const raw = await connection.get(`${PREFIX}:result:${id}`);
+  return raw ? JSON.parse(raw) : null;
+}